@@ -93,6 +93,8 @@ class ProviderSettings(BaseSettings):
     gemini_max_output_tokens: int = 16384  # Configurable token limit (increased from 8192)
     gemini_request_timeout: int = 180  # API timeout in seconds
     gemini_temperature: float = 1.0  # Temperature for generation (Gemini 3 optimized for 1.0)
+    gemini_inline_max_bytes: int = 20 * 1024 * 1024  # Larger audio is uploaded via the File API
+    gemini_max_concurrency: int = 4  # Concurrent requests in transcribe_batch
 
     # ElevenLabs
     elevenlabs_api_key: str = ""
@@ -121,6 +123,8 @@ class ProviderSettings(BaseSettings):
     wav_api_url: str = "https://wav.am"
     wav_project_name: str = "STT-Tool"
     wav_rpm_limit: int = 60
+    # JSON file persisting resolved project IDs across restarts. Empty disables.
+    wav_project_cache_file: str = ""
 
 
 class ChunkingSettings(BaseSettings):
@@ -180,6 +184,7 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
     log_format: Literal["json", "console"] = "console"
+    log_raw_responses: bool = False  # Log full provider response bodies (can be very large)
 
     # Server
     host: str = "0.0.0.0"
@@ -192,6 +197,11 @@ class Settings(BaseSettings):
     # Set to 0 to disable automatic cleanup.
     job_retention_days: int = 7
 
+    # On-disk cache of provider responses keyed by audio hash + request
+    # fingerprint. Useful in development to avoid re-spending API calls on
+    # identical chunks. Empty string disables the cache.
+    transcript_cache_dir: str = ""
+
     # File upload limits
     max_upload_size: int = 500 * 1024 * 1024  # 500MB
 
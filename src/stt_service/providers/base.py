@@ -2,7 +2,23 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Final
+
+# Languages assumed supported unless a provider overrides supports_language
+_DEFAULT_LANGS: Final = frozenset(("hy", "en", "ru"))
+
+
+def as_float(value: Any, default: float = 0.0) -> float:
+    """Convert a timestamp from a provider response to float.
+
+    Values that are already floats (the common case for JSON numbers) are
+    returned without a float() call; None maps to the default.
+    """
+    if type(value) is float:
+        return value
+    if value is None:
+        return default
+    return float(value)
 
 
 @dataclass
@@ -38,9 +54,12 @@ class TranscriptionConfig:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionSegment:
-    """A single transcribed segment."""
+    """A single transcribed segment.
+
+    Providers build hundreds of these per chunk, so the class uses slots.
+    """
 
     text: str
     start_time: float
@@ -137,6 +156,14 @@ class BaseSTTProvider(ABC):
         """
         return bool(self.api_key)
 
+    async def warm_up(self) -> None:
+        """Prepare the provider before the first transcription.
+
+        Providers override this to open connections or resolve resources
+        ahead of time. It must not raise: a failed warm-up only means the
+        first request pays the setup cost itself.
+        """
+
     def supports_diarization(self) -> bool:
         """Check if provider supports speaker diarization.
 
@@ -155,7 +182,7 @@ class BaseSTTProvider(ABC):
             True if language is supported
         """
         # By default, assume Armenian, English, Russian are supported
-        return language in ["hy", "en", "ru"]
+        return language in _DEFAULT_LANGS
 
     def build_prompt(self, config: TranscriptionConfig) -> str:
         """Build a prompt string from configuration.
@@ -1,8 +1,10 @@
 """ElevenLabs STT provider."""
 
+import asyncio
 from pathlib import Path
 
 import httpx
+import orjson
 import structlog
 
 from stt_service.config import get_settings
@@ -101,7 +103,7 @@ class ElevenLabsProvider(BaseSTTProvider):
                     retryable=response.status_code >= 500,
                 )
 
-            result = response.json()
+            result = orjson.loads(response.content)
             return self._parse_response(result, config)
 
         except (RateLimitError, ProviderError):
@@ -121,7 +123,8 @@ class ElevenLabsProvider(BaseSTTProvider):
         """Transcribe audio from a file."""
         path = Path(file_path)
         audio_format = path.suffix.lstrip(".").lower()
-        audio_data = path.read_bytes()
+        # Read off the event loop so other transcriptions keep making progress
+        audio_data = await asyncio.to_thread(path.read_bytes)
         return await self.transcribe(audio_data, config, audio_format)
 
     def _map_language_code(self, language: str) -> str:
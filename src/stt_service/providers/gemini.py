@@ -1,11 +1,14 @@
 """Google Gemini STT provider."""
 
-import base64
-import mimetypes
+import asyncio
+import io
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 import google.generativeai as genai
+import orjson
 import structlog
 
 from stt_service.config import get_settings
@@ -14,12 +17,196 @@ from stt_service.providers.base import (
     TranscriptionConfig,
     TranscriptionResponse,
     TranscriptionSegment,
+    as_float,
 )
+from stt_service.services.transcript_cache import get_transcript_cache
 from stt_service.utils.exceptions import ProviderError, RateLimitError
 
 logger = structlog.get_logger()
 settings = get_settings()
 
+# Server-suggested backoff in Gemini 429 errors, e.g.
+# "Please retry in 13.4s." / "retry_delay { seconds: 13 }"
+_RETRY_DELAY_RE = re.compile(r"retry_delay\s*\{\s*seconds:\s*(\d+)|retry in (\d+(?:\.\d+)?)\s*s", re.IGNORECASE)
+_DEFAULT_RETRY_AFTER = 60.0
+
+# Candidate.FinishReason values reported in metadata
+_FINISH_REASON_MAP: Final[dict[int, str]] = {
+    1: "STOP",
+    2: "MAX_TOKENS",
+    3: "SAFETY",
+    4: "RECITATION",
+    5: "OTHER",
+}
+
+# Seconds between File API state checks while an upload is being processed
+_FILE_POLL_INTERVAL = 1.0
+
+# MIME types for supported_formats; anything else is sent as WAV (the worker
+# normalizes uploads to WAV before chunking)
+_MIME_TYPES: Final[dict[str, str]] = {
+    "mp3": "audio/mp3",
+    "wav": "audio/wav",
+    "m4a": "audio/m4a",
+    "flac": "audio/flac",
+    "ogg": "audio/ogg",
+    "webm": "audio/webm",
+    "aac": "audio/aac",
+}
+
+# Language names used in prompts, keyed by ISO code
+_LANG_NAMES: Final[dict[str, str]] = {
+    "hy": "Armenian",
+    "en": "English",
+    "ru": "Russian",
+    "fr": "French",
+    "de": "German",
+    "es": "Spanish",
+    "auto": "Auto Detect",
+}
+
+_TRAILING_COMMA_RE = re.compile(r",\s*([\]\}])")
+# Fields every response segment must carry (shared by the response schema and validation)
+_SEGMENT_FIELDS = ("speaker", "start", "end", "text")
+_REQUIRED_SEGMENT_KEYS = frozenset(_SEGMENT_FIELDS)
+_TIMESTAMP_TYPES = (int, float, str)
+
+# A complete "text": "..." field; requires the closing quote so truncated text is skipped
+_TEXT_FIELD_RE = re.compile(r'"text"\s*:\s*"((?:[^"\\]|\\.)*)"\s*[,}]', re.DOTALL)
+
+
+def _parse_retry_after(error_msg: str) -> float:
+    """Extract the server-suggested retry delay from a rate-limit error message."""
+    match = _RETRY_DELAY_RE.search(error_msg)
+    if not match:
+        return _DEFAULT_RETRY_AFTER
+    return float(match.group(1) or match.group(2))
+
+
+# JSON string escapes, decoded in one regex pass. Surrogate pairs are matched
+# together so characters outside the BMP (e.g. emoji) come out whole; unknown
+# escapes are left as they are.
+_ESCAPE_RE = re.compile(
+    r'\\(?:u([dD][89abAB][0-9a-fA-F]{2})\\u([dD][c-fC-F][0-9a-fA-F]{2})'
+    r'|u([0-9a-fA-F]{4})|(["\\/bfnrt]))'
+)
+_SIMPLE_ESCAPES: Final[dict[str, str]] = {
+    '"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t",
+}
+
+
+def _replace_escape(match: re.Match[str]) -> str:
+    high, low, code, char = match.groups()
+    if char:
+        return _SIMPLE_ESCAPES[char]
+    if code:
+        return chr(int(code, 16))
+    return chr(0x10000 + ((int(high, 16) - 0xD800) << 10) + (int(low, 16) - 0xDC00))
+
+
+def _unescape_json_string(s: str) -> str:
+    """Decode the escapes in the body of a JSON string literal.
+
+    Avoids the unicode_escape codec, whose latin-1 handling causes mojibake.
+    """
+    if "\\" not in s:
+        return s
+    return _ESCAPE_RE.sub(_replace_escape, s)
+
+
+_PROMPT_HEADER = "Transcribe the following audio accurately."
+
+
+@lru_cache(maxsize=256)
+def _job_prompt_lines(
+    language: str | None,
+    additional_languages: tuple[str, ...],
+    diarization_enabled: bool,
+    max_speakers: int | None,
+    custom_vocabulary: tuple[str, ...],
+    prompt: str | None,
+) -> tuple[str, ...]:
+    """Render the prompt lines that only depend on job-level options."""
+    lang_name = _LANG_NAMES.get
+    lines = []
+    if language and language.lower() != "auto":
+        lines.append(f"Primary language: {lang_name(language, language)}.")
+    else:
+        lines.append("Detect the primary language and transcribe.")
+
+    if additional_languages:
+        langs = ", ".join([lang_name(l, l) for l in additional_languages])
+        lines.append(f"The audio may also contain: {langs}.")
+
+    if diarization_enabled:
+        lines.append(
+            "Identify different speakers and label them as SPEAKER_00, SPEAKER_01, etc."
+        )
+        if max_speakers:
+            lines.append(f"There are at most {max_speakers} speakers.")
+
+    if custom_vocabulary:
+        vocab = ", ".join(custom_vocabulary)
+        lines.append(f"Important terms that may appear: {vocab}.")
+
+    if prompt:
+        lines.append(f"Context: {prompt}")
+
+    return tuple(lines)
+
+
+def _decode_json_object(text: str) -> Any:
+    """Decode the JSON object in a model response.
+
+    The object may be wrapped in markdown code fences or surrounded by prose.
+    Returns None if no object can be decoded.
+    """
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end < start:
+        return None
+    # Slicing the whole string returns it as-is, so bare JSON is not copied
+    json_str = text[start:end + 1]
+    try:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        pass
+
+    # Try cleaning common issues like trailing commas, then give up
+    cleaned_json = _TRAILING_COMMA_RE.sub(r"\1", json_str)
+    try:
+        return orjson.loads(cleaned_json)
+    except orjson.JSONDecodeError:
+        logger.warning("Failed to parse Gemini JSON after cleaning", text=text)
+        return None
+
+
+def _build_response_schema() -> genai.protos.Schema:
+    """Build the structured-output schema for transcription responses.
+
+    Passing a protos.Schema lets the SDK send it as-is instead of converting
+    a dict schema on every request. Descriptions are sent as input tokens on
+    every call; keep them short.
+    """
+    Schema, Type = genai.protos.Schema, genai.protos.Type
+    segment = Schema(
+        type_=Type.OBJECT,
+        properties={
+            "speaker": Schema(type_=Type.STRING, description="SPEAKER_XX id"),
+            "start": Schema(type_=Type.NUMBER, description="start seconds"),
+            "end": Schema(type_=Type.NUMBER, description="end seconds"),
+            "text": Schema(type_=Type.STRING, description="spoken text"),
+        },
+        required=list(_SEGMENT_FIELDS),
+    )
+    return Schema(
+        type_=Type.OBJECT,
+        properties={
+            "segments": Schema(type_=Type.ARRAY, description="speaker segments", items=segment),
+        },
+        required=["segments"],  # Removed full_text to save ~50% tokens
+    )
+
 
 class GeminiProvider(BaseSTTProvider):
     """Google Gemini multimodal STT provider."""
@@ -35,6 +222,51 @@ class GeminiProvider(BaseSTTProvider):
         super().__init__(key)
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel(settings.providers.gemini_model)
+        self._cache = get_transcript_cache()
+        # Built once and reused by every request
+        # Gemini 3 is optimized for temperature=1.0 (default)
+        self._generation_config = {
+            "temperature": settings.providers.gemini_temperature,
+            "max_output_tokens": settings.providers.gemini_max_output_tokens,
+            "response_mime_type": "application/json",
+            # JSON schema for structured output validation
+            "response_schema": _build_response_schema(),
+        }
+
+    async def transcribe_batch(
+        self,
+        chunks: list[bytes],
+        configs: list[TranscriptionConfig],
+        audio_format: str = "wav",
+    ) -> list[TranscriptionResponse]:
+        """Transcribe independent chunks concurrently.
+
+        At most ``gemini_max_concurrency`` requests are in flight at once.
+        Only use this for chunks that do not depend on each other: context
+        from previous chunks requires them to be transcribed in order.
+
+        Args:
+            chunks: Audio data of each chunk
+            configs: Transcription config of each chunk (same order)
+            audio_format: Audio format shared by all chunks
+
+        Returns:
+            Responses in the same order as the chunks
+        """
+        if len(chunks) != len(configs):
+            raise ValueError("chunks and configs must have the same length")
+
+        semaphore = asyncio.Semaphore(max(1, settings.providers.gemini_max_concurrency))
+
+        async def transcribe_one(audio_data: bytes, config: TranscriptionConfig) -> TranscriptionResponse:
+            async with semaphore:
+                return await self.transcribe(audio_data, config, audio_format)
+
+        return list(
+            await asyncio.gather(
+                *(transcribe_one(audio_data, config) for audio_data, config in zip(chunks, configs))
+            )
+        )
 
     async def transcribe(
         self,
@@ -45,7 +277,13 @@ class GeminiProvider(BaseSTTProvider):
         """Transcribe audio using Gemini multimodal API."""
         import time
         start_time = time.time()
-        
+        # Bind the per-request context once instead of repeating it on every event
+        log = logger.bind(
+            chunk_index=config.chunk_index,
+            model=settings.providers.gemini_model,
+            audio_size=len(audio_data),
+        )
+
         try:
             # Get MIME type
             mime_type = self._get_mime_type(audio_format)
@@ -53,115 +291,99 @@ class GeminiProvider(BaseSTTProvider):
             # Build prompt for Gemini
             prompt = self._build_transcription_prompt(config)
 
-            logger.info(
-                "Gemini API request",
-                audio_size=len(audio_data),
-                mime_type=mime_type,
-                model=settings.providers.gemini_model,
-            )
-
-            logger.info(
-                "========== GEMINI PROMPT ==========",
-                chunk_index=config.chunk_index,
-                prompt=prompt,
-            )
-
-            # Create audio part
-            audio_part = {
-                "mime_type": mime_type,
-                "data": base64.b64encode(audio_data).decode("utf-8"),
-            }
-
-            # Generate transcription
-            # Gemini 3 is optimized for temperature=1.0 (default)
-            # Build response schema with duration constraints
-            segment_properties = {
-                "speaker": {
-                    "type": "string",
-                    "description": "Speaker identifier (e.g., SPEAKER_00, SPEAKER_01)"
-                },
-                "start": {
-                    "type": "number",
-                    "description": "Segment start time in seconds"
-                },
-                "end": {
-                    "type": "number",
-                    "description": "Segment end time in seconds"
-                },
-                "text": {
-                    "type": "string",
-                    "description": "Transcribed text for this segment"
-                }
-            }
-
-            generation_config = genai.GenerationConfig(
-                temperature=settings.providers.gemini_temperature,
-                max_output_tokens=settings.providers.gemini_max_output_tokens,
-                response_mime_type="application/json",
-                # JSON schema for structured output validation
-                response_schema={
-                    "type": "object",
-                    "properties": {
-                        "segments": {
-                            "type": "array",
-                            "description": "Array of transcribed segments with speaker identification and timestamps",
-                            "items": {
-                                "type": "object",
-                                "properties": segment_properties,
-                                "required": ["speaker", "start", "end", "text"]
-                            }
-                        }
-                    },
-                    "required": ["segments"]  # Removed full_text to save ~50% tokens
-                }
-            )
+            # Short-circuit identical requests (same audio, model and prompt)
+            # (hashing and file I/O run off the event loop)
+            cache_key = None
+            if self._cache:
+                cache_key = await asyncio.to_thread(
+                    self._cache.make_key,
+                    audio_data,
+                    settings.providers.gemini_model,
+                    settings.providers.gemini_temperature,
+                    settings.providers.gemini_max_output_tokens,
+                    prompt,
+                )
+                cached = await asyncio.to_thread(self._cache.get, cache_key)
+                if cached:
+                    log.info("Gemini transcript cache hit")
+                    # No tokens were spent and no API latency was paid on this request
+                    latency_ms = int((time.time() - start_time) * 1000)
+                    cached.metadata.update(
+                        cache_hit=True,
+                        input_tokens=0,
+                        output_tokens=0,
+                        processing_latency_ms=latency_ms,
+                    )
+                    cached.processing_time_ms = latency_ms
+                    return cached
+
+            log.info("Gemini API request", mime_type=mime_type, prompt_chars=len(prompt))
+            # Full prompt/response dumps are debug-only; they are large and are
+            # also kept in the result metadata
+            log.debug("========== GEMINI PROMPT ==========", prompt=prompt)
+
+            # Create audio part. Small payloads are inlined as raw bytes (the SDK
+            # encodes them for transport); large ones go through the File API so
+            # the request body stays small.
+            uploaded_file = None
+            if len(audio_data) > settings.providers.gemini_inline_max_bytes:
+                log.info("Uploading audio via Gemini File API")
+                uploaded_file = await self._upload_audio(audio_data, mime_type)
+                audio_part = uploaded_file
+            else:
+                audio_part = {"mime_type": mime_type, "data": audio_data}
 
-            response = await self.model.generate_content_async(
-                [prompt, audio_part],
-                generation_config=generation_config,
-                request_options={"timeout": settings.providers.gemini_request_timeout},
-            )
+            try:
+                response = await self.model.generate_content_async(
+                    [prompt, audio_part],
+                    generation_config=self._generation_config,
+                    request_options={"timeout": settings.providers.gemini_request_timeout},
+                )
+            finally:
+                if uploaded_file is not None:
+                    await self._delete_uploaded_file(uploaded_file)
 
             # Calculate processing latency
             processing_latency_ms = int((time.time() - start_time) * 1000)
 
-            logger.info(
+            # response.text is recomputed from the candidate parts on every access
+            response_text = getattr(response, "text", "")
+
+            log.debug(
                 "========== GEMINI RESPONSE ==========",
-                chunk_index=config.chunk_index,
                 latency_ms=processing_latency_ms,
-                response_text=response.text if hasattr(response, 'text') else "",
+                response_text=response_text,
             )
 
+            max_output_tokens = self._generation_config["max_output_tokens"]
+
             # Extract finish reason
             finish_reason_str = "UNKNOWN"
             finish_reason_value = None
             if response.candidates:
                 finish_reason = response.candidates[0].finish_reason
-                finish_reason_value = finish_reason if isinstance(finish_reason, int) else finish_reason.value
-                # Map finish reason value to string
-                finish_reason_map = {1: "STOP", 2: "MAX_TOKENS", 3: "SAFETY", 4: "RECITATION", 5: "OTHER"}
-                finish_reason_str = finish_reason_map.get(finish_reason_value, f"UNKNOWN_{finish_reason_value}")
+                # Plain ints and the SDK's IntEnum both convert directly
+                finish_reason_value = int(finish_reason)
+                finish_reason_str = _FINISH_REASON_MAP.get(finish_reason_value, f"UNKNOWN_{finish_reason_value}")
 
                 # FinishReason.MAX_TOKENS = 2 (not 3!)
                 if finish_reason_value == 2:
-                    logger.error(
+                    log.error(
                         "Gemini response truncated due to token limit",
-                        chunk_index=config.chunk_index,
                         audio_duration=config.audio_duration,
                         finish_reason=finish_reason,
                     )
                     raise ProviderError(
-                        message=f"Transcription truncated: exceeded {generation_config.max_output_tokens} tokens. "
+                        message=f"Transcription truncated: exceeded {max_output_tokens} tokens. "
                                 f"Chunk too long ({config.audio_duration:.1f}s). Reduce chunk size.",
                         provider=self.name,
                         retryable=False,
                     )
                 elif finish_reason_value not in [1, 2]:  # 1 = STOP, 2 = MAX_TOKENS
-                    logger.warning(
+                    log.warning(
                         "Gemini finished with unexpected reason",
                         finish_reason=finish_reason,
                         finish_reason_value=finish_reason_value,
-                        chunk_index=config.chunk_index,
                     )
 
             # Extract token usage metrics
@@ -172,25 +394,22 @@ class GeminiProvider(BaseSTTProvider):
                 input_tokens = getattr(usage, 'prompt_token_count', 0) or 0
                 output_tokens = getattr(usage, 'candidates_token_count', 0) or 0
 
-                logger.info(
+                log.info(
                     "========== GEMINI TOKENS ==========",
-                    chunk_index=config.chunk_index,
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
-                    max_allowed=generation_config.max_output_tokens,
-                    utilization_pct=round(100 * output_tokens / generation_config.max_output_tokens, 1) if output_tokens else 0,
+                    max_allowed=max_output_tokens,
+                    utilization_pct=round(100 * output_tokens / max_output_tokens, 1) if output_tokens else 0,
                 )
 
                 # Warn if approaching limit (>80%)
-                if output_tokens > 0.8 * generation_config.max_output_tokens:
-                    logger.warning(
+                if output_tokens > 0.8 * max_output_tokens:
+                    log.warning(
                         "Approaching token limit",
-                        chunk_index=config.chunk_index,
                         audio_duration=config.audio_duration,
                     )
 
             # Build metadata dict
-            raw_response_text = response.text if hasattr(response, 'text') else ""
             response_metadata = {
                 "model": settings.providers.gemini_model,
                 "prompt": prompt,
@@ -198,7 +417,7 @@ class GeminiProvider(BaseSTTProvider):
                 "output_tokens": output_tokens,
                 "processing_latency_ms": processing_latency_ms,
                 "finish_reason": finish_reason_str,
-                "raw_response": raw_response_text,
+                "raw_response": response_text,
             }
 
             # Parse response
@@ -209,18 +428,29 @@ class GeminiProvider(BaseSTTProvider):
                  # Fallback: 16-bit 16kHz mono = 32KB/s
                  duration_est = len(audio_data) / 32000
 
-            return self._parse_response(response, config, duration=duration_est, extra_metadata=response_metadata)
+            # Decoding and segment construction are CPU-bound; keep them off the loop
+            result = await asyncio.to_thread(
+                self._parse_response, response_text, config, duration_est, response_metadata
+            )
+            # Only cache clean results so a retry can still fix a degraded transcription
+            if (
+                cache_key
+                and finish_reason_str == "STOP"
+                and "error" not in result.metadata
+                and "fallback" not in result.metadata
+            ):
+                await asyncio.to_thread(self._cache.put, cache_key, result)
+            return result
 
         except Exception as e:
             error_msg = str(e)
             error_type = type(e).__name__
             
             # Log the full error details
-            logger.error(
+            log.error(
                 "Gemini API error",
                 error_type=error_type,
                 error_message=error_msg,
-                audio_size=len(audio_data),
             )
             
             error_lower = error_msg.lower()
@@ -228,7 +458,8 @@ class GeminiProvider(BaseSTTProvider):
                 raise RateLimitError(
                     message=f"Gemini rate limit exceeded: {error_msg}",
                     provider=self.name,
-                    retry_after=60,  # Default 60 seconds
+                    # Honor the server's RetryInfo instead of a blind 60s stall
+                    retry_after=_parse_retry_after(error_msg),
                 ) from e
             raise ProviderError(
                 message=f"Gemini transcription failed: {error_msg}",
@@ -252,29 +483,56 @@ class GeminiProvider(BaseSTTProvider):
         """Transcribe audio from a file."""
         path = Path(file_path)
         audio_format = path.suffix.lstrip(".").lower()
-        audio_data = path.read_bytes()
+        # Read off the event loop so concurrent chunk requests keep progressing
+        audio_data = await asyncio.to_thread(path.read_bytes)
         return await self.transcribe(audio_data, config, audio_format)
 
+    async def _upload_audio(self, audio_data: bytes, mime_type: str) -> Any:
+        """Upload audio through the Gemini File API and wait until it is usable."""
+        uploaded = await asyncio.to_thread(
+            genai.upload_file, io.BytesIO(audio_data), mime_type=mime_type
+        )
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.providers.gemini_request_timeout
+        while uploaded.state.name == "PROCESSING":
+            if loop.time() > deadline:
+                await self._delete_uploaded_file(uploaded)
+                raise ProviderError(
+                    message=f"Gemini file {uploaded.name} is still processing after upload",
+                    provider=self.name,
+                )
+            await asyncio.sleep(_FILE_POLL_INTERVAL)
+            uploaded = await asyncio.to_thread(genai.get_file, uploaded.name)
+
+        if uploaded.state.name == "FAILED":
+            await self._delete_uploaded_file(uploaded)
+            raise ProviderError(
+                message=f"Gemini file processing failed for {uploaded.name}",
+                provider=self.name,
+                retryable=False,
+            )
+        return uploaded
+
+    async def _delete_uploaded_file(self, uploaded: Any) -> None:
+        """Delete an uploaded file. Failures are logged; files expire on their own."""
+        try:
+            await asyncio.to_thread(genai.delete_file, uploaded.name)
+        except Exception as e:
+            logger.warning("Failed to delete Gemini file", file_name=uploaded.name, error=str(e))
+
     def _get_mime_type(self, audio_format: str) -> str:
         """Get MIME type for audio format."""
-        mime_types = {
-            "mp3": "audio/mp3",
-            "wav": "audio/wav",
-            "m4a": "audio/m4a",
-            "flac": "audio/flac",
-            "ogg": "audio/ogg",
-            "webm": "audio/webm",
-            "aac": "audio/aac",
-        }
-        return mime_types.get(audio_format, mimetypes.guess_type(f"file.{audio_format}")[0] or "audio/wav")
+        return _MIME_TYPES.get(audio_format, "audio/wav")
 
     def _build_transcription_prompt_new(self, config: TranscriptionConfig) -> str:
         """Build structured Gemini prompt for transcription."""
         sections = []
 
         # --- SYSTEM ROLE ---
-        primary_lang = self._get_language_name(config.language) if config.language and config.language.lower() != "auto" else None
-        additional_langs = [self._get_language_name(l) for l in config.additional_languages] if config.additional_languages else []
+        lang_name = _LANG_NAMES.get
+        primary_lang = lang_name(config.language, config.language) if config.language and config.language.lower() != "auto" else None
+        additional_langs = [lang_name(l, l) for l in config.additional_languages]
 
         if primary_lang and additional_langs:
             lang_desc = f"{primary_lang}-multilingual"
@@ -382,28 +640,13 @@ class GeminiProvider(BaseSTTProvider):
         constraint_lines.append("- **Output**: Valid JSON only.")
         sections.append("\n".join(constraint_lines))
 
-        # --- OUTPUT FORMAT ---
-        sections.append(
-            '### OUTPUT FORMAT\n'
-            '{\n'
-            '  "segments": [\n'
-            '    {\n'
-            '      "speaker": "SPEAKER_XX",\n'
-            '      "start": 0.0,\n'
-            '      "end": 0.0,\n'
-            '      "text": "..."\n'
-            '    }\n'
-            '  ]\n'
-            '}'
-        )
+        # Output format is enforced by response_schema; no example block needed.
 
         return "\n\n".join(sections)
 
     def _build_transcription_prompt(self, config: TranscriptionConfig) -> str:
         """Legacy prompt builder (pre-structured format). Kept for reference/rollback."""
-        prompt_parts = [
-            "Transcribe the following audio accurately.",
-        ]
+        prompt_parts = [_PROMPT_HEADER]
 
         if config.audio_duration:
             prompt_parts.append(
@@ -430,227 +673,148 @@ class GeminiProvider(BaseSTTProvider):
 
             logger.info("Injecting context into prompt", chunk_index=config.chunk_index, context_length=len(config.previous_transcript_context))
 
-        if config.language and config.language.lower() != "auto":
-            prompt_parts.append(f"Primary language: {self._get_language_name(config.language)}.")
-        else:
-            prompt_parts.append("Detect the primary language and transcribe.")
-
-        if config.additional_languages:
-            langs = ", ".join(self._get_language_name(l) for l in config.additional_languages)
-            prompt_parts.append(f"The audio may also contain: {langs}.")
-
-        if config.diarization_enabled:
-            prompt_parts.append(
-                "Identify different speakers and label them as SPEAKER_00, SPEAKER_01, etc."
+        # The rest depends only on job-level options, so it is identical for
+        # every chunk of a job and rendered once
+        prompt_parts.extend(
+            _job_prompt_lines(
+                config.language,
+                tuple(config.additional_languages),
+                config.diarization_enabled,
+                config.max_speakers,
+                tuple(config.custom_vocabulary),
+                config.prompt,
             )
-            if config.max_speakers:
-                prompt_parts.append(f"There are at most {config.max_speakers} speakers.")
-
-        if config.custom_vocabulary:
-            vocab = ", ".join(config.custom_vocabulary)
-            prompt_parts.append(f"Important terms that may appear: {vocab}.")
-
-        if config.prompt:
-            prompt_parts.append(f"Context: {config.prompt}")
-
-        prompt_parts.append(
-            """
-Output format (JSON):
-{
-  "segments": [
-    {
-      "speaker": "SPEAKER_00",
-      "start": 0.0,
-      "end": 5.5,
-      "text": "transcribed text here"
-    }
-  ]
-}
-"""
         )
 
+        # No JSON example block: response_schema already constrains the output
+        # format, so repeating it here only costs input tokens on every call.
+
         return "\n".join(prompt_parts)
 
-    def _get_language_name(self, code: str) -> str:
+    @staticmethod
+    def _get_language_name(code: str) -> str:
         """Get language name from ISO code."""
-        names = {
-            "hy": "Armenian",
-            "en": "English",
-            "ru": "Russian",
-            "fr": "French",
-            "de": "German",
-            "es": "Spanish",
-            "auto": "Auto Detect",
-        }
-        return names.get(code, code)
+        return _LANG_NAMES.get(code, code)
 
     def _parse_response(
         self,
-        response: Any,
+        text: str,
         config: TranscriptionConfig,
         duration: float = 0.0,
         extra_metadata: dict[str, Any] | None = None,
     ) -> TranscriptionResponse:
-        """Parse Gemini response into TranscriptionResponse."""
-        import json
-        import re
+        """Parse Gemini response text into TranscriptionResponse.
 
+        Synchronous so it can run in a worker thread.
+        """
         try:
-            # Extract text from response
-            text = response.text
             if not text:
-                raise ProviderError("Gemini returned empty response")
-            
-            # Debug log raw response (full)
-            logger.info("Gemini raw response text", full_text=text, total_length=len(text))
+                raise ProviderError("Gemini returned empty response", provider=self.name)
 
-            # Try to find JSON in response (it might be wrapped in markdown code blocks)
-            # Find the first { and the last }
-            json_match = re.search(r"\{.*\}", text, re.DOTALL)
-            
-            data = None
-            if json_match:
-                try:
-                    json_str = json_match.group(0)
-                    data = json.loads(json_str)
-                except json.JSONDecodeError:
-                    # Try cleaning common issues like trailing commas or markdown escapes
-                    cleaned_json = re.sub(r",\s*([\]\}])", r"\1", json_str)
-                    try:
-                        data = json.loads(cleaned_json)
-                    except json.JSONDecodeError:
-                        logger.warning("Failed to parse Gemini JSON after cleaning", text=text)
-
-            if data and isinstance(data, dict):
-                # Strict Validation
-                self._validate_json_structure(data)
-
-                segments_data = data.get("segments", [])
-                segments = []
-                for seg in segments_data:
-                    segments.append(
-                        TranscriptionSegment(
-                            text=seg.get("text", "").strip(),
-                            start_time=float(seg.get("start", 0)),
-                            end_time=float(seg.get("end", 0)),
-                            speaker_id=seg.get("speaker", "SPEAKER_00"),
-                            confidence=seg.get("confidence"),
-                        )
-                    )
+            # The full text can be megabytes; only dump it when explicitly asked to
+            if settings.log_raw_responses:
+                logger.info("Gemini raw response text", full_text=text, total_length=len(text))
 
-                # Alignment pass: rescale timestamps to fit within chunk duration
-                if duration > 0 and segments:
-                    segments = self._align_timestamps(segments, duration, config.chunk_index)
-
-                # Reconstruct full_text from segments (Gemini no longer provides it to save tokens)
-                full_text = " ".join(s.text for s in segments) if segments else ""
-
-                if full_text or segments:
-                    # Merge extra_metadata with base metadata
-                    metadata = {"model": settings.providers.gemini_model}
-                    if extra_metadata:
-                        metadata.update(extra_metadata)
-                    return TranscriptionResponse(
-                        text=full_text,
-                        segments=segments,
-                        language_detected=config.language,
-                        metadata=metadata,
-                    )
+            data = _decode_json_object(text)
+            if not isinstance(data, dict):
+                return self._parse_response_regex_fallback(text, config, duration, extra_metadata)
 
-            # Fallback: RegExp Extraction instead of raw dump
-            # If JSON parsing failed, try to extract 'text' fields using regex
-            # Pattern matches: "text": "..."
-            logger.warning("Falling back to regex extraction for Gemini response")
+            # Strict validation and segment construction in a single pass
+            segments, texts = self._build_segments(data)
+            if not segments:
+                return self._parse_response_regex_fallback(text, config, duration, extra_metadata)
 
-            # Check if response appears truncated
-            if not text.rstrip().endswith('}') or text.count('{') != text.count('}'):
-                logger.error(
-                    "Gemini response appears truncated (malformed JSON)",
-                    ends_with=text[-50:] if len(text) > 50 else text,
-                )
+            # Alignment pass: rescale timestamps to fit within chunk duration
+            if duration > 0:
+                segments = self._align_timestamps(segments, duration, config.chunk_index)
 
-            # Require closing quote (don't accept truncated text)
-            matches = re.findall(r'"text"\s*:\s*"((?:[^"\\]|\\.)*)"\s*[,}]', text, re.DOTALL)
+            # Reconstruct full_text from segments (Gemini no longer provides it to save tokens)
+            # (alignment only touches timestamps, so the collected texts still apply)
+            full_text = " ".join(texts)
 
-            if not matches:
-                # If strict regex fails, log and raise error
-                logger.error(
-                    "Failed to extract any text from Gemini response",
-                    response_length=len(text),
-                    response_preview=text[:500],
-                )
-                raise ProviderError(
-                    "Failed to parse Gemini response: JSON is malformed and regex extraction failed. "
-                    "This may indicate truncated output."
-                )
-
-            if matches:
-                def unescape_string(s):
-                    try:
-                        # Try standard JSON unescape first
-                        return json.loads(f'"{s}"')
-                    except Exception:
-                        # Fallback: manual unescape of common JSON escapes
-                        # This avoids the unicode_escape latin-1 pitfall that causes mojibake
-                        return s.replace('\\"', '"').replace('\\n', '\n').replace('\\\\', '\\')
-
-                full_text = " ".join(unescape_string(match) for match in matches)
-                # Merge extra_metadata with fallback metadata
-                metadata = {"model": settings.providers.gemini_model, "fallback": "regex"}
-                if extra_metadata:
-                    metadata.update(extra_metadata)
-                return TranscriptionResponse(
-                    text=full_text,
-                    segments=[
-                        TranscriptionSegment(
-                            text=full_text,
-                            start_time=0.0,
-                            end_time=duration,  # Use estimated duration (better than 0)
-                            speaker_id="SPEAKER_00",
-                        )
-                    ],
-                    language_detected=config.language,
-                    metadata=metadata,
-                )
-
-            # Last resort: Plain text cleanup
-            clean_text = text.strip()
-            clean_text = re.sub(r"```[a-z]*\n?", "", clean_text)
-            clean_text = clean_text.replace("```", "").strip()
-            # If it still looks like JSON, it's probably broken JSON, but we shouldn't show it as transcript
-            if clean_text.startswith("{") and "segments" in clean_text:
-                 # It's broken JSON and regex failed.
-                 raise ProviderError("Failed to parse Gemini response: Invalid JSON and regex extraction failed.")
-
-            # Merge extra_metadata with raw_response metadata
-            metadata = {"model": settings.providers.gemini_model, "raw_response": True}
+            # Merge extra_metadata with base metadata
+            metadata = {"model": settings.providers.gemini_model}
             if extra_metadata:
                 metadata.update(extra_metadata)
             return TranscriptionResponse(
-                text=clean_text,
-                segments=[
-                    TranscriptionSegment(
-                        text=clean_text,
-                        start_time=0.0,
-                        end_time=0.0,
-                        speaker_id="SPEAKER_00",
-                    )
-                ],
+                text=full_text,
+                segments=segments,
                 language_detected=config.language,
                 metadata=metadata,
             )
 
         except Exception as e:
-            logger.error("Error parsing Gemini response", error=str(e), text=response.text[:500] if hasattr(response, 'text') else str(response))
+            logger.error("Error parsing Gemini response", error=str(e), text=text[:500])
             # Last resort fallback
-            fallback_text = str(response.text) if hasattr(response, 'text') else "Error parsing response"
             return TranscriptionResponse(
-                text=fallback_text,
+                text=text,
                 segments=[],
                 language_detected=config.language,
                 metadata={"error": str(e)},
             )
 
+    def _parse_response_regex_fallback(
+        self,
+        text: str,
+        config: TranscriptionConfig,
+        duration: float,
+        extra_metadata: dict[str, Any] | None,
+    ) -> TranscriptionResponse:
+        """Recover transcript text from a response whose JSON could not be decoded.
+
+        Extracts the "text" fields with a regex and returns them as a single
+        segment spanning the chunk.
+
+        Raises:
+            ProviderError: If no complete "text" field can be found.
+        """
+        # RegExp Extraction instead of raw dump
+        # Pattern matches: "text": "..."
+        logger.warning("Falling back to regex extraction for Gemini response")
+
+        # Check if response appears truncated
+        if not text.rstrip().endswith('}') or text.count('{') != text.count('}'):
+            logger.error(
+                "Gemini response appears truncated (malformed JSON)",
+                ends_with=text[-50:] if len(text) > 50 else text,
+            )
+
+        # Require closing quote (don't accept truncated text). Matches are
+        # unescaped as the scan yields them, without an intermediate list.
+        texts = [_unescape_json_string(m.group(1)) for m in _TEXT_FIELD_RE.finditer(text)]
+
+        if not texts:
+            # If strict regex fails, log and raise error
+            logger.error(
+                "Failed to extract any text from Gemini response",
+                response_length=len(text),
+                response_preview=text[:500],
+            )
+            raise ProviderError(
+                "Failed to parse Gemini response: JSON is malformed and regex extraction failed. "
+                "This may indicate truncated output.",
+                provider=self.name,
+            )
+
+        full_text = " ".join(texts)
+        # Merge extra_metadata with fallback metadata
+        metadata = {"model": settings.providers.gemini_model, "fallback": "regex"}
+        if extra_metadata:
+            metadata.update(extra_metadata)
+        return TranscriptionResponse(
+            text=full_text,
+            segments=[
+                TranscriptionSegment(
+                    text=full_text,
+                    start_time=0.0,
+                    end_time=duration,  # Use estimated duration (better than 0)
+                    speaker_id="SPEAKER_00",
+                )
+            ],
+            language_detected=config.language,
+            metadata=metadata,
+        )
+
     def supports_language(self, language: str) -> bool:
         """Gemini supports a wide range of languages."""
         # Gemini multimodal supports many languages including Armenian
@@ -671,8 +835,14 @@ Output format (JSON):
         if not segments:
             return segments
 
-        max_end = max(s.end_time for s in segments)
-        min_start = min(s.start_time for s in segments)
+        # Single pass for both bounds
+        max_end = float("-inf")
+        min_start = float("inf")
+        for seg in segments:
+            if seg.end_time > max_end:
+                max_end = seg.end_time
+            if seg.start_time < min_start:
+                min_start = seg.start_time
 
         needs_rescale = max_end > duration * 1.05  # 5% tolerance
         needs_negative_fix = min_start < 0
@@ -710,35 +880,56 @@ Output format (JSON):
 
         return aligned
 
-    def _validate_json_structure(self, data: dict[str, Any]) -> None:
-        """Validate that the parsed JSON matches the expected schema.
-        
+    def _build_segments(
+        self, data: dict[str, Any]
+    ) -> tuple[list[TranscriptionSegment], list[str]]:
+        """Validate the parsed JSON and build segments in a single pass.
+
         Args:
             data: The parsed JSON dictionary.
-            
+
+        Returns:
+            The segments and their texts, in response order.
+
         Raises:
-            ProviderError: If validation fails (caught by caller to trigger fallback).
+            ProviderError: If validation fails.
         """
         if "segments" not in data:
             logger.warning("JSON validation failed: missing 'segments' key")
-            raise ProviderError("JSON validation failed: missing 'segments' key")
-            
-        segments = data.get("segments")
-        if not isinstance(segments, list):
+            raise ProviderError("JSON validation failed: missing 'segments' key", provider=self.name)
+
+        segments_data = data["segments"]
+        if not isinstance(segments_data, list):
             logger.warning("JSON validation failed: 'segments' is not a list")
-            raise ProviderError("JSON validation failed: 'segments' is not a list")
-            
-        for i, seg in enumerate(segments):
+            raise ProviderError("JSON validation failed: 'segments' is not a list", provider=self.name)
+
+        # Collect the texts alongside the segments so full_text is one join
+        segments = []
+        texts = []
+        # Bound once for the loop below, which runs per segment
+        make_segment = TranscriptionSegment
+        add_segment = segments.append
+        add_text = texts.append
+        for i, seg in enumerate(segments_data):
             if not isinstance(seg, dict):
-                 raise ProviderError(f"Segment {i} is not a dict")
-            
-            required_keys = ["speaker", "start", "end", "text"]
-            for key in required_keys:
-                if key not in seg:
-                    logger.warning(f"JSON validation failed: segment {i} missing '{key}'", segment=seg)
-                    raise ProviderError(f"Segment {i} missing required key: {key}")
-            
-            # Type checks (loose validation, direct casting happens in parse)
-            if not isinstance(seg.get("start"), (int, float, str)) or not isinstance(seg.get("end"), (int, float, str)):
-                 logger.warning(f"JSON validation failed: segment {i} timestamps invalid", segment=seg)
-                 raise ProviderError(f"Segment {i} timestamps invalid type")
+                raise ProviderError(f"Segment {i} is not a dict", provider=self.name)
+
+            # One C-level subset check; the missing key is only looked up on failure
+            if not _REQUIRED_SEGMENT_KEYS.issubset(seg):
+                key = next(k for k in _SEGMENT_FIELDS if k not in seg)
+                logger.warning(f"JSON validation failed: segment {i} missing '{key}'", segment=seg)
+                raise ProviderError(f"Segment {i} missing required key: {key}", provider=self.name)
+
+            # Type checks (loose validation, direct casting happens below)
+            start = seg["start"]
+            end = seg["end"]
+            if not isinstance(start, _TIMESTAMP_TYPES) or not isinstance(end, _TIMESTAMP_TYPES):
+                logger.warning(f"JSON validation failed: segment {i} timestamps invalid", segment=seg)
+                raise ProviderError(f"Segment {i} timestamps invalid type", provider=self.name)
+
+            seg_text = seg["text"].strip()
+            add_text(seg_text)
+            # Positional: text, start_time, end_time, speaker_id, confidence
+            add_segment(make_segment(seg_text, as_float(start), as_float(end), seg["speaker"], seg.get("confidence")))
+
+        return segments, texts
@@ -1,8 +1,10 @@
 """HiSpeech STT provider - Armenian-optimized speech recognition."""
 
 from pathlib import Path
+from typing import BinaryIO, Final
 
 import httpx
+import orjson
 import structlog
 
 from stt_service.config import get_settings
@@ -11,12 +13,17 @@ from stt_service.providers.base import (
     TranscriptionConfig,
     TranscriptionResponse,
     TranscriptionSegment,
+    as_float,
 )
+from stt_service.providers.http import error_snippet, get_shared_client
 from stt_service.utils.exceptions import ProviderError, RateLimitError
 
 logger = structlog.get_logger()
 settings = get_settings()
 
+# HiSpeech is Armenian-focused but may support other languages
+_HISPEECH_LANGS: Final = frozenset(("hy", "en", "ru"))
+
 
 class HiSpeechProvider(BaseSTTProvider):
     """HiSpeech Armenian-optimized STT provider.
@@ -35,12 +42,13 @@ class HiSpeechProvider(BaseSTTProvider):
         key = api_key or settings.providers.hispeech_api_key
         super().__init__(key)
         self.base_url = settings.providers.hispeech_api_url
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
+        # Shared with other HiSpeech instances in the same event loop
+        self.client = get_shared_client(
+            self.base_url,
             headers={
                 "x-auth-token": self.api_key,
             },
-            timeout=httpx.Timeout(300.0),  # 5 minute timeout
+            timeout=httpx.Timeout(300.0, connect=10.0),  # 5 minute timeout, fail fast on connect
         )
 
     async def transcribe(
@@ -54,10 +62,34 @@ class HiSpeechProvider(BaseSTTProvider):
         Note: This implementation is based on common STT API patterns.
         Adjust endpoints and payload structure based on actual HiSpeech API docs.
         """
+        return await self._upload(audio_data, config, audio_format)
+
+    async def transcribe_file(
+        self,
+        file_path: str,
+        config: TranscriptionConfig,
+    ) -> TranscriptionResponse:
+        """Transcribe audio from a file.
+
+        The open file is handed to httpx, which streams it into the multipart
+        body in chunks instead of holding a full copy in memory.
+        """
+        path = Path(file_path)
+        audio_format = path.suffix.lstrip(".").lower()
+        with path.open("rb") as audio_file:
+            return await self._upload(audio_file, config, audio_format)
+
+    async def _upload(
+        self,
+        audio: bytes | BinaryIO,
+        config: TranscriptionConfig,
+        audio_format: str,
+    ) -> TranscriptionResponse:
+        """Send audio (bytes or a binary file object) to the HiSpeech upload endpoint."""
         try:
             # Prepare multipart form data
             files = {
-                "file": (f"audio.{audio_format}", audio_data, f"audio/{audio_format}"),
+                "file": (f"audio.{audio_format}", audio, f"audio/{audio_format}"),
             }
 
             # Build request payload
@@ -84,14 +116,13 @@ class HiSpeechProvider(BaseSTTProvider):
 
             # Handle errors
             if response.status_code != 200:
-                error_text = response.text
                 raise ProviderError(
-                    message=f"HiSpeech API error ({response.status_code}): {error_text}",
+                    message=f"HiSpeech API error ({response.status_code}): {error_snippet(response)}",
                     provider=self.name,
                     retryable=response.status_code >= 500,
                 )
 
-            result = response.json()
+            result = orjson.loads(response.content)
             return self._parse_response(result, config)
 
         except (RateLimitError, ProviderError):
@@ -109,17 +140,6 @@ class HiSpeechProvider(BaseSTTProvider):
                 retryable=True,
             ) from e
 
-    async def transcribe_file(
-        self,
-        file_path: str,
-        config: TranscriptionConfig,
-    ) -> TranscriptionResponse:
-        """Transcribe audio from a file."""
-        path = Path(file_path)
-        audio_format = path.suffix.lstrip(".").lower()
-        audio_data = path.read_bytes()
-        return await self.transcribe(audio_data, config, audio_format)
-
     def _parse_response(
         self,
         result: dict,
@@ -129,21 +149,35 @@ class HiSpeechProvider(BaseSTTProvider):
 
         Note: Adjust field names based on actual HiSpeech API response format.
         """
-        # Debug log raw response
-        logger.info("HiSpeech raw response", result=result)
+        # The full response is large and also kept in metadata; only dump it
+        # when explicitly asked to
+        if settings.log_raw_responses:
+            logger.info("HiSpeech raw response", result=result)
         
         segments = []
 
         # Try different common response formats
         raw_segments = result.get("segments") or result.get("utterances") or []
 
+        # Field names differ between response formats; pick them once from the
+        # first segment instead of trying both names on every segment
+        first = raw_segments[0] if raw_segments else {}
+        text_key = "text" if "text" in first else "transcript"
+        start_key = "start" if "start" in first else "start_time"
+        end_key = "end" if "end" in first else "end_time"
+        speaker_key = "speaker" if "speaker" in first else "speaker_id"
+
+        # Texts are collected as segments are built in case full_text has to be joined
+        texts = []
         for seg in raw_segments:
+            seg_text = seg.get(text_key) or ""
+            texts.append(seg_text)
             segments.append(
                 TranscriptionSegment(
-                    text=seg.get("text") or seg.get("transcript", ""),
-                    start_time=float(seg.get("start") or seg.get("start_time", 0)),
-                    end_time=float(seg.get("end") or seg.get("end_time", 0)),
-                    speaker_id=seg.get("speaker") or seg.get("speaker_id"),
+                    text=seg_text,
+                    start_time=as_float(seg.get(start_key) or 0.0),
+                    end_time=as_float(seg.get(end_key) or 0.0),
+                    speaker_id=seg.get(speaker_key),
                     confidence=seg.get("confidence"),
                     words=seg.get("words"),
                 )
@@ -156,7 +190,7 @@ class HiSpeechProvider(BaseSTTProvider):
             or result.get("transcription", "")
         )
         if not full_text and segments:
-            full_text = " ".join(s.text for s in segments)
+            full_text = " ".join(texts)
 
         # If no segments but we have text, create a single segment
         if not segments and full_text:
@@ -181,9 +215,7 @@ class HiSpeechProvider(BaseSTTProvider):
 
     def supports_language(self, language: str) -> bool:
         """Check language support - HiSpeech is optimized for Armenian."""
-        # HiSpeech is Armenian-focused but may support other languages
-        supported = ["hy", "en", "ru"]
-        return language in supported
+        return language in _HISPEECH_LANGS
 
     def supports_diarization(self) -> bool:
         """Check if HiSpeech supports diarization."""
@@ -191,8 +223,11 @@ class HiSpeechProvider(BaseSTTProvider):
         return True
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Release the HTTP client.
+
+        The client is shared per event loop, so it is left open here and
+        closed by close_shared_clients() when the loop shuts down.
+        """
 
     async def health_check(self) -> bool:
         """Check HiSpeech API availability."""
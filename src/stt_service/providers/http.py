@@ -0,0 +1,150 @@
+"""Shared httpx clients for HTTP-based providers.
+
+httpx connection pools are bound to the event loop that opened them, and the
+Celery worker runs every task in a fresh loop. Clients are therefore shared
+per (event loop, base URL, headers): provider instances created in the same
+loop reuse one connection pool and its TLS sessions, while a new loop never
+picks up connections from a closed one.
+
+All clients of a loop sit on one transport, so every provider draws from a
+single connection pool. Each client only gets a view of that transport, so
+closing one client leaves the pool open for the others; the transports are
+closed by close_shared_clients(). The SSL context does not depend on the loop and is
+created once per process, since loading the CA bundle is the slowest part of
+building a transport.
+"""
+
+import asyncio
+import socket
+import ssl
+import weakref
+
+import httpx
+
+# Connection pool limits for shared provider clients
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# TCP keepalive probes stop NATs and load balancers from silently dropping
+# idle pooled connections; TCP_NODELAY sends small frames without delay
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, ...], httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, httpx.AsyncHTTPTransport]]" = (
+    weakref.WeakKeyDictionary()
+)
+_ssl_context: ssl.SSLContext | None = None
+
+# Longest part of an error response body quoted in exception messages
+ERROR_SNIPPET_BYTES = 2048
+
+
+def _get_ssl_context() -> ssl.SSLContext:
+    """Get the process-wide SSL context used by every transport."""
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = httpx.create_ssl_context()
+    return _ssl_context
+
+
+def _make_transport(http2: bool, limits: httpx.Limits) -> httpx.AsyncHTTPTransport:
+    return httpx.AsyncHTTPTransport(
+        verify=_get_ssl_context(),
+        http2=http2,
+        limits=limits,
+        socket_options=_SOCKET_OPTIONS,
+    )
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """A client's handle on a shared transport, which the client cannot close."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # The transport outlives any single client
+        pass
+
+
+def get_shared_client(
+    base_url: str,
+    headers: dict[str, str],
+    timeout: httpx.Timeout,
+    http2: bool = True,
+    limits: httpx.Limits = DEFAULT_LIMITS,
+) -> httpx.AsyncClient:
+    """Get the shared client for a base URL and headers in the running loop.
+
+    Args:
+        base_url: API base URL
+        headers: Default request headers (including credentials)
+        timeout: Client timeout, applied when the client is first created
+        http2: Negotiate HTTP/2, so concurrent requests share one connection
+        limits: Connection pool limits of the underlying transport
+
+    Returns:
+        The shared client, or a new unshared client when called outside a
+        running event loop
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            transport=_make_transport(http2, limits),
+        )
+
+    key = (base_url, *(f"{name}:{value}" for name, value in sorted(headers.items())))
+    loop_clients = _clients.setdefault(loop, {})
+    client = loop_clients.get(key)
+    if client is None or client.is_closed:
+        # Clients with the same transport settings share one pool
+        transport_key = (http2, limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry)
+        loop_transports = _transports.setdefault(loop, {})
+        transport = loop_transports.get(transport_key)
+        if transport is None:
+            transport = _make_transport(http2, limits)
+            loop_transports[transport_key] = transport
+
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            transport=_SharedTransport(transport),
+        )
+        loop_clients[key] = client
+    return client
+
+
+def error_snippet(response: httpx.Response) -> str:
+    """Get the start of an error response body for an exception message.
+
+    Only the first ERROR_SNIPPET_BYTES are decoded, so a large error page
+    is neither parsed nor copied in full.
+    """
+    return response.content[:ERROR_SNIPPET_BYTES].decode("utf-8", "replace")
+
+
+async def close_shared_clients() -> None:
+    """Close every shared client (and transport) of the running event loop."""
+    loop = asyncio.get_running_loop()
+    loop_clients = _clients.pop(loop, {})
+    loop_transports = _transports.pop(loop, {})
+    for client in loop_clients.values():
+        await client.aclose()
+    for transport in loop_transports.values():
+        await transport.aclose()
@@ -1,8 +1,15 @@
 """wav.am STT provider - Armenian-optimized speech recognition."""
 
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
 from pathlib import Path
+from typing import BinaryIO, Final
 
 import httpx
+import orjson
 import structlog
 
 from stt_service.config import get_settings
@@ -12,11 +19,58 @@ from stt_service.providers.base import (
     TranscriptionResponse,
     TranscriptionSegment,
 )
+from stt_service.providers.http import error_snippet, get_shared_client
 from stt_service.utils.exceptions import ProviderError, RateLimitError
 
 logger = structlog.get_logger()
 settings = get_settings()
 
+_WAV_LANGS: Final = frozenset(("hy", "en", "ru"))
+
+# Project IDs resolved in this process, keyed by _project_cache_key()
+_project_ids: dict[str, str] = {}
+
+
+def _project_cache_key(base_url: str, api_key: str, project_name: str) -> str:
+    """Key identifying a project of one account (the API key is hashed)."""
+    key_digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    return f"{base_url}|{key_digest}|{project_name}"
+
+
+def _read_project_ids(path: Path) -> dict[str, str]:
+    """Read persisted project IDs, treating a missing or bad file as empty."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable wav.am project cache", path=str(path), error=str(e))
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _persist_project_id(path: Path, key: str, project_id: str | None) -> None:
+    """Store (or with None, remove) one project ID in the cache file."""
+    project_ids = _read_project_ids(path)
+    if project_id is None:
+        if project_ids.pop(key, None) is None:
+            return
+    else:
+        project_ids[key] = project_id
+
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so readers never see partial JSON
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(project_ids, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Failed to write wav.am project cache", path=str(path), error=str(e))
+        if tmp_path:
+            Path(tmp_path).unlink(missing_ok=True)
+
 
 class WavProvider(BaseSTTProvider):
     """wav.am Armenian-optimized STT provider.
@@ -37,10 +91,16 @@ class WavProvider(BaseSTTProvider):
         self.base_url = settings.providers.wav_api_url
         self.project_name = settings.providers.wav_project_name
         self._project_id: str | None = None
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
+        # Whether _project_id came from the cache rather than the API
+        self._project_id_cached = False
+        self._project_key = _project_cache_key(self.base_url, self.api_key, self.project_name)
+        cache_file = settings.providers.wav_project_cache_file
+        self._project_cache_file = Path(cache_file) if cache_file else None
+        # Shared with other wav.am instances in the same event loop
+        self.client = get_shared_client(
+            self.base_url,
             headers={"Authorization": self.api_key},
-            timeout=httpx.Timeout(300.0),
+            timeout=httpx.Timeout(300.0, connect=10.0),
         )
         logger.info(
             "Initialized WavProvider", 
@@ -49,10 +109,45 @@ class WavProvider(BaseSTTProvider):
         )
 
     async def _ensure_project(self) -> str:
-        """Get or create a wav.am project, caching the ID for reuse."""
+        """Get or create a wav.am project, caching the ID for reuse.
+
+        Resolved IDs are kept for the lifetime of the process and, when
+        PROVIDER_WAV_PROJECT_CACHE_FILE is set, across restarts.
+        """
         if self._project_id:
             return self._project_id
 
+        project_id = _project_ids.get(self._project_key)
+        if project_id is None and self._project_cache_file:
+            persisted = await asyncio.to_thread(_read_project_ids, self._project_cache_file)
+            project_id = persisted.get(self._project_key)
+        if project_id:
+            _project_ids[self._project_key] = project_id
+            self._project_id = project_id
+            self._project_id_cached = True
+            return project_id
+
+        project_id = await self._resolve_project()
+        _project_ids[self._project_key] = project_id
+        if self._project_cache_file:
+            await asyncio.to_thread(
+                _persist_project_id, self._project_cache_file, self._project_key, project_id
+            )
+        return project_id
+
+    async def _forget_project(self) -> None:
+        """Drop a cached project ID that the API no longer accepts."""
+        logger.warning("Dropping cached wav.am project ID", project_id=self._project_id)
+        self._project_id = None
+        self._project_id_cached = False
+        _project_ids.pop(self._project_key, None)
+        if self._project_cache_file:
+            await asyncio.to_thread(
+                _persist_project_id, self._project_cache_file, self._project_key, None
+            )
+
+    async def _resolve_project(self) -> str:
+        """Look up the project by name via the API, creating it if missing."""
         try:
             # Look for existing project by name
             response = await self.client.post(
@@ -60,22 +155,20 @@ class WavProvider(BaseSTTProvider):
                 json={},
             )
             if response.status_code == 200:
-                projects = response.json()
-                # Handle list response (API returns list of dicts)
-                if isinstance(projects, list):
-                    for project in projects:
-                        if project.get("name") == self.project_name:
-                            self._project_id = str(project["id"])
-                            logger.info("Found existing wav.am project", project_id=self._project_id, name=self.project_name)
-                            return self._project_id
-                # Handle potential dict response (future proofing)
-                elif isinstance(projects, dict):
-                    project_list = projects.get("projects", [])
-                    for project in project_list:
-                        if project.get("name") == self.project_name:
-                            self._project_id = str(project["id"])
-                            logger.info("Found existing wav.am project", project_id=self._project_id, name=self.project_name)
-                            return self._project_id
+                projects = orjson.loads(response.content)
+                # API returns a list of dicts; accept {"projects": [...]} too (future proofing)
+                if isinstance(projects, dict):
+                    projects = projects.get("projects", [])
+                project_name = self.project_name
+                # First match wins, so stop scanning as soon as it is found
+                project_id = next(
+                    (project["id"] for project in projects if project.get("name") == project_name),
+                    None,
+                )
+                if project_id is not None:
+                    self._project_id = str(project_id)
+                    logger.info("Found existing wav.am project", project_id=self._project_id, name=project_name)
+                    return self._project_id
 
             # Project not found — create it
             response = await self.client.post(
@@ -84,12 +177,12 @@ class WavProvider(BaseSTTProvider):
             )
             if response.status_code != 200:
                 raise ProviderError(
-                    message=f"wav.am add_project failed ({response.status_code}): {response.text}",
+                    message=f"wav.am add_project failed ({response.status_code}): {error_snippet(response)}",
                     provider=self.name,
                     retryable=False,
                 )
 
-            result = response.json()
+            result = orjson.loads(response.content)
             # API returns raw project ID (integer), not a dict
             if isinstance(result, int):
                 self._project_id = str(result)
@@ -114,11 +207,37 @@ class WavProvider(BaseSTTProvider):
         audio_format: str = "wav",
     ) -> TranscriptionResponse:
         """Transcribe audio using wav.am API."""
+        return await self._upload(audio_data, len(audio_data), config, audio_format)
+
+    async def transcribe_file(
+        self,
+        file_path: str,
+        config: TranscriptionConfig,
+    ) -> TranscriptionResponse:
+        """Transcribe audio from a file.
+
+        The open file is handed to httpx, which streams it into the multipart
+        body in chunks instead of holding a full copy in memory.
+        """
+        path = Path(file_path)
+        audio_format = path.suffix.lstrip(".").lower()
+        with path.open("rb") as audio_file:
+            audio_size = os.fstat(audio_file.fileno()).st_size
+            return await self._upload(audio_file, audio_size, config, audio_format)
+
+    async def _upload(
+        self,
+        audio: bytes | BinaryIO,
+        audio_size: int,
+        config: TranscriptionConfig,
+        audio_format: str,
+    ) -> TranscriptionResponse:
+        """Send audio (bytes or a binary file object) to the wav.am transcribe endpoint."""
         try:
             project_id = await self._ensure_project()
 
             files = {
-                "audio_file": (f"audio.{audio_format}", audio_data, f"audio/{audio_format}"),
+                "audio_file": (f"audio.{audio_format}", audio, f"audio/{audio_format}"),
             }
 
             # wav.am requires a specific language code, not "auto"
@@ -137,7 +256,7 @@ class WavProvider(BaseSTTProvider):
                 "Sending request to wav.am",
                 language=data["language"],
                 num_speakers=num_speakers,
-                audio_size=len(audio_data),
+                audio_size=audio_size,
             )
 
             response = await self.client.post(
@@ -155,13 +274,17 @@ class WavProvider(BaseSTTProvider):
                 )
 
             if response.status_code != 200:
-                error_text = response.text
+                error_text = error_snippet(response)
                 
                 # Check for known non-retryable errors
                 is_retryable = response.status_code >= 500
                 if response.status_code == 500 and "Failed to transcribe audio" in error_text:
                     # This specific 500 error from wav.am seems permanent for certain files
                     is_retryable = False
+                elif response.status_code in (400, 404) and self._project_id_cached:
+                    # The cached project may have been deleted; resolve it again on retry
+                    await self._forget_project()
+                    is_retryable = True
                 
                 raise ProviderError(
                     message=f"wav.am API error ({response.status_code}): {error_text}",
@@ -169,7 +292,7 @@ class WavProvider(BaseSTTProvider):
                     retryable=is_retryable,
                 )
 
-            result = response.json()
+            result = orjson.loads(response.content)
             return self._parse_response(result, config)
 
         except (RateLimitError, ProviderError):
@@ -187,17 +310,6 @@ class WavProvider(BaseSTTProvider):
                 retryable=True,
             ) from e
 
-    async def transcribe_file(
-        self,
-        file_path: str,
-        config: TranscriptionConfig,
-    ) -> TranscriptionResponse:
-        """Transcribe audio from a file."""
-        path = Path(file_path)
-        audio_format = path.suffix.lstrip(".").lower()
-        audio_data = path.read_bytes()
-        return await self.transcribe(audio_data, config, audio_format)
-
     def _parse_response(
         self,
         result: dict | str | list,
@@ -213,19 +325,22 @@ class WavProvider(BaseSTTProvider):
 
         if isinstance(result, list):
             # API returns list of {"speaker": "...", "text": "..."}
+            # Collect the texts while building segments instead of re-scanning
+            texts: list[str] = []
             for item in result:
-                speaker = item.get("speaker", "speaker_0")
-                text = item.get("text", "")
-                if text:
-                    segments.append(
-                        TranscriptionSegment(
-                            text=text,
-                            start_time=0.0,
-                            end_time=chunk_duration,
-                            speaker_id=speaker,
-                        )
+                text = item.get("text")
+                if not text:
+                    continue
+                texts.append(text)
+                segments.append(
+                    TranscriptionSegment(
+                        text=text,
+                        start_time=0.0,
+                        end_time=chunk_duration,
+                        speaker_id=item.get("speaker", "speaker_0"),
                     )
-            full_text = " ".join(item.get("text", "") for item in result if item.get("text"))
+                )
+            full_text = " ".join(texts)
         elif isinstance(result, str):
             full_text = result
             if full_text:
@@ -256,9 +371,18 @@ class WavProvider(BaseSTTProvider):
             metadata={"provider": "wav"},
         )
 
+    async def warm_up(self) -> None:
+        """Resolve the project ID (and open the connection) ahead of time."""
+        if not self.api_key:
+            return
+        try:
+            await self._ensure_project()
+        except ProviderError as e:
+            logger.warning("wav.am warm-up failed", error=e.message)
+
     def supports_language(self, language: str) -> bool:
         """Check language support."""
-        return language in ["hy", "en", "ru"]
+        return language in _WAV_LANGS
 
     def supports_diarization(self) -> bool:
         """wav.am supports speaker diarization via num_speakers."""
@@ -269,5 +393,8 @@ class WavProvider(BaseSTTProvider):
         return bool(self.api_key)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Release the HTTP client.
+
+        The client is shared per event loop, so it is left open here and
+        closed by close_shared_clients() when the loop shuts down.
+        """
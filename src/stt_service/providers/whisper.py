@@ -1,8 +1,10 @@
 """OpenAI Whisper STT provider."""
 
 from pathlib import Path
+from typing import BinaryIO
 
 import httpx
+import orjson
 import structlog
 
 from stt_service.config import get_settings
@@ -11,7 +13,9 @@ from stt_service.providers.base import (
     TranscriptionConfig,
     TranscriptionResponse,
     TranscriptionSegment,
+    as_float,
 )
+from stt_service.providers.http import error_snippet, get_shared_client
 from stt_service.utils.exceptions import ProviderError, RateLimitError
 
 logger = structlog.get_logger()
@@ -33,12 +37,13 @@ class WhisperProvider(BaseSTTProvider):
         key = api_key or settings.providers.openai_api_key
         super().__init__(key)
         self.model = settings.providers.openai_model
-        self.client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
+        # Shared with other Whisper instances in the same event loop
+        self.client = get_shared_client(
+            self.BASE_URL,
             headers={
                 "Authorization": f"Bearer {self.api_key}",
             },
-            timeout=httpx.Timeout(300.0),
+            timeout=httpx.Timeout(300.0, connect=10.0),
         )
 
     async def transcribe(
@@ -48,10 +53,34 @@ class WhisperProvider(BaseSTTProvider):
         audio_format: str = "wav",
     ) -> TranscriptionResponse:
         """Transcribe audio using OpenAI Whisper API."""
+        return await self._upload(audio_data, config, audio_format)
+
+    async def transcribe_file(
+        self,
+        file_path: str,
+        config: TranscriptionConfig,
+    ) -> TranscriptionResponse:
+        """Transcribe audio from a file.
+
+        The open file is handed to httpx, which streams it into the multipart
+        body in chunks instead of holding a full copy in memory.
+        """
+        path = Path(file_path)
+        audio_format = path.suffix.lstrip(".").lower()
+        with path.open("rb") as audio_file:
+            return await self._upload(audio_file, config, audio_format)
+
+    async def _upload(
+        self,
+        audio: bytes | BinaryIO,
+        config: TranscriptionConfig,
+        audio_format: str,
+    ) -> TranscriptionResponse:
+        """Send audio (bytes or a binary file object) to the transcriptions endpoint."""
         try:
             # Build multipart form data
             files = {
-                "file": (f"audio.{audio_format}", audio_data, f"audio/{audio_format}"),
+                "file": (f"audio.{audio_format}", audio, f"audio/{audio_format}"),
             }
 
             data = {
@@ -88,14 +117,13 @@ class WhisperProvider(BaseSTTProvider):
                 )
 
             if response.status_code != 200:
-                error_data = response.json() if response.headers.get("content-type", "").startswith("application/json") else {"error": response.text}
                 raise ProviderError(
-                    message=f"OpenAI API error ({response.status_code}): {error_data}",
+                    message=f"OpenAI API error ({response.status_code}): {error_snippet(response)}",
                     provider=self.name,
                     retryable=response.status_code >= 500,
                 )
 
-            result = response.json()
+            result = orjson.loads(response.content)
             return self._parse_response(result, config)
 
         except (RateLimitError, ProviderError):
@@ -107,54 +135,52 @@ class WhisperProvider(BaseSTTProvider):
                 retryable=True,
             ) from e
 
-    async def transcribe_file(
-        self,
-        file_path: str,
-        config: TranscriptionConfig,
-    ) -> TranscriptionResponse:
-        """Transcribe audio from a file."""
-        path = Path(file_path)
-        audio_format = path.suffix.lstrip(".").lower()
-        audio_data = path.read_bytes()
-        return await self.transcribe(audio_data, config, audio_format)
-
     def _parse_response(
         self,
         result: dict,
         config: TranscriptionConfig,
     ) -> TranscriptionResponse:
         """Parse OpenAI Whisper response."""
-        segments = []
-
-        for seg in result.get("segments", []):
-            words = None
-            if "words" in result and config.timestamp_granularity == "word":
-                # Match words to this segment by time
-                seg_words = [
-                    w for w in result["words"]
-                    if w.get("start", 0) >= seg.get("start", 0)
-                    and w.get("end", 0) <= seg.get("end", 0)
-                ]
-                if seg_words:
-                    words = [
-                        {
-                            "text": w.get("word", ""),
-                            "start_time": w.get("start", 0),
-                            "end_time": w.get("end", 0),
-                        }
-                        for w in seg_words
-                    ]
-
-            segments.append(
-                TranscriptionSegment(
-                    text=seg.get("text", "").strip(),
-                    start_time=float(seg.get("start", 0)),
-                    end_time=float(seg.get("end", 0)),
-                    speaker_id="SPEAKER_00",  # Whisper doesn't do diarization
-                    confidence=seg.get("avg_logprob"),
-                    words=words,
-                )
+        # Word timestamps are only attached when requested; Whisper returns
+        # both lists in time order, so words are matched to segments in one
+        # forward pass instead of scanning every word for every segment
+        words = result.get("words") if config.timestamp_granularity == "word" else None
+        if words:
+            words = sorted(words, key=lambda w: w.get("start", 0))
+        word_count = len(words) if words else 0
+        word_idx = 0
+
+        def match_words(seg: dict) -> list[dict] | None:
+            nonlocal word_idx
+            seg_start = seg.get("start", 0)
+            seg_end = seg.get("end", 0)
+            # Words starting before this segment cannot match it or any later one
+            while word_idx < word_count and words[word_idx].get("start", 0) < seg_start:
+                word_idx += 1
+            end_idx = word_idx
+            while end_idx < word_count and words[end_idx].get("start", 0) <= seg_end:
+                end_idx += 1
+            return [
+                {
+                    "text": w.get("word", ""),
+                    "start_time": w.get("start", 0),
+                    "end_time": w.get("end", 0),
+                }
+                for w in words[word_idx:end_idx]
+                if w.get("end", 0) <= seg_end
+            ] or None
+
+        segments = [
+            TranscriptionSegment(
+                text=seg.get("text", "").strip(),
+                start_time=as_float(seg.get("start")),
+                end_time=as_float(seg.get("end")),
+                speaker_id="SPEAKER_00",  # Whisper doesn't do diarization
+                confidence=seg.get("avg_logprob"),
+                words=match_words(seg) if word_count else None,
             )
+            for seg in result.get("segments", [])
+        ]
 
         return TranscriptionResponse(
             text=result.get("text", "").strip(),
@@ -166,6 +192,15 @@ class WhisperProvider(BaseSTTProvider):
             },
         )
 
+    async def warm_up(self) -> None:
+        """Open the connection to the OpenAI API ahead of the first upload."""
+        if not self.api_key:
+            return
+        try:
+            await self.client.get("/models", timeout=10)
+        except httpx.HTTPError as e:
+            logger.warning("Whisper warm-up failed", error=str(e))
+
     def supports_diarization(self) -> bool:
         """Whisper doesn't support speaker diarization natively."""
         return False
@@ -176,5 +211,8 @@ class WhisperProvider(BaseSTTProvider):
         return True
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Release the HTTP client.
+
+        The client is shared per event loop, so it is left open here and
+        closed by close_shared_clients() when the loop shuts down.
+        """
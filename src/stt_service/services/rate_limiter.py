@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+from collections import deque
 from dataclasses import dataclass, field
 
 import structlog
@@ -9,7 +10,7 @@ import structlog
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitState:
     """State for a single rate limit bucket."""
 
@@ -18,11 +19,23 @@ class RateLimitState:
     max_tokens: float
     refill_rate: float  # tokens per second
     adaptive_factor: float = 1.0  # Multiplier for backoff
+    # refill_rate * adaptive_factor and its inverse, kept in sync by
+    # set_adaptive_factor() so the request path does no extra arithmetic
+    effective_rate: float = field(init=False, repr=False)
+    inv_effective_rate: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.set_adaptive_factor(self.adaptive_factor)
+
+    def set_adaptive_factor(self, factor: float) -> None:
+        """Change the backoff multiplier and the derived rates."""
+        self.adaptive_factor = factor
+        self.effective_rate = self.refill_rate * factor
+        self.inv_effective_rate = 1.0 / self.effective_rate
 
     def get_available_tokens(self, now: float) -> float:
         """Calculate available tokens at given time."""
-        elapsed = now - self.last_update
-        new_tokens = elapsed * self.refill_rate * self.adaptive_factor
+        new_tokens = (now - self.last_update) * self.effective_rate
         return min(self.max_tokens, self.tokens + new_tokens)
 
 
@@ -33,21 +46,29 @@ class RateLimiter:
     - Per-provider rate limiting
     - Adaptive rate based on 429 responses
     - Pre-emptive throttling
-    - Async-safe with locks
+    - Waiters woken early when the rate is restored
+    - Waiters admitted in arrival order, ahead of later callers
     """
 
     def __init__(self) -> None:
         self._buckets: dict[str, RateLimitState] = {}
-        self._locks: dict[str, asyncio.Lock] = {}
-        self._global_lock = asyncio.Lock()
-
-    async def _get_lock(self, provider: str) -> asyncio.Lock:
-        """Get or create a lock for a provider."""
-        if provider not in self._locks:
-            async with self._global_lock:
-                if provider not in self._locks:
-                    self._locks[provider] = asyncio.Lock()
-        return self._locks[provider]
+        self._conditions: dict[str, asyncio.Condition] = {}
+        # Callers waiting for tokens, in arrival order. Only the first may
+        # take tokens, and nobody skips the queue while it is non-empty.
+        self._waiters: dict[str, deque[object]] = {}
+        # Loop the conditions were created for. The Celery worker runs each
+        # task in a new loop, and asyncio primitives cannot be waited on from
+        # another loop.
+        self._conditions_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_condition(self, provider: str) -> asyncio.Condition | None:
+        """Get the condition for a provider, or None if it has no rate limit."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._conditions_loop:
+            self._conditions = {name: asyncio.Condition() for name in self._buckets}
+            self._waiters = {name: deque() for name in self._buckets}
+            self._conditions_loop = loop
+        return self._conditions.get(provider)
 
     def configure_provider(
         self,
@@ -73,6 +94,9 @@ class RateLimiter:
             max_tokens=float(burst_size),
             refill_rate=refill_rate,
         )
+        # Created up front so lookups on the request path never allocate
+        self._conditions.setdefault(provider, asyncio.Condition())
+        self._waiters.setdefault(provider, deque())
 
         logger.info(
             "Configured rate limiter",
@@ -81,6 +105,26 @@ class RateLimiter:
             burst=burst_size,
         )
 
+    @staticmethod
+    def _try_consume(bucket: RateLimitState, tokens: float) -> float:
+        """Take tokens from a bucket if enough are available.
+
+        There is no await between reading and updating the bucket, so this
+        is atomic on the event loop without holding a lock.
+
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds until they will be
+        """
+        now = time.monotonic()
+        available = bucket.get_available_tokens(now)
+
+        if available >= tokens:
+            bucket.tokens = available - tokens
+            bucket.last_update = now
+            return 0.0
+
+        return (tokens - available) * bucket.inv_effective_rate
+
     async def acquire(self, provider: str, tokens: float = 1.0) -> float:
         """Acquire tokens from the bucket, waiting if necessary.
 
@@ -91,44 +135,47 @@ class RateLimiter:
         Returns:
             Wait time in seconds (0 if no wait needed)
         """
-        lock = await self._get_lock(provider)
-
-        async with lock:
-            if provider not in self._buckets:
-                # No rate limit configured
-                return 0.0
-
-            bucket = self._buckets[provider]
-            now = time.monotonic()
-
-            # Calculate available tokens
-            available = bucket.get_available_tokens(now)
-
-            if available >= tokens:
-                # Tokens available, consume and return
-                bucket.tokens = available - tokens
-                bucket.last_update = now
-                return 0.0
-
-            # Calculate wait time
-            tokens_needed = tokens - available
-            wait_time = tokens_needed / (bucket.refill_rate * bucket.adaptive_factor)
-
-            logger.debug(
-                "Rate limit wait",
-                provider=provider,
-                wait_seconds=wait_time,
-                tokens_needed=tokens_needed,
-            )
-
-            # Wait for tokens
-            await asyncio.sleep(wait_time)
-
-            # Update state after wait
-            bucket.tokens = 0  # We'll use all accumulated tokens
-            bucket.last_update = time.monotonic()
-
-            return wait_time
+        bucket = self._buckets.get(provider)
+        if bucket is None:
+            # No rate limit configured
+            return 0.0
+
+        # Fast path: nobody is queued and tokens are available, no lock needed
+        if not self._waiters.get(provider) and self._try_consume(bucket, tokens) == 0.0:
+            return 0.0
+
+        # Out of tokens (or others are queued): join the queue. The first
+        # waiter sleeps until its tokens are due, or until report_success
+        # raises the rate; the others sleep until the queue moves.
+        condition = self._get_condition(provider)
+        waiters = self._waiters[provider]
+        started = time.monotonic()
+        async with condition:
+            waiter = object()
+            waiters.append(waiter)
+            try:
+                while True:
+                    wait_time = None
+                    if waiters[0] is waiter:
+                        wait_time = self._try_consume(bucket, tokens)
+                        if wait_time == 0.0:
+                            break
+                        logger.debug(
+                            "Rate limit wait",
+                            provider=provider,
+                            wait_seconds=wait_time,
+                            tokens=tokens,
+                        )
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout=wait_time)
+                    except TimeoutError:
+                        pass
+            finally:
+                waiters.remove(waiter)
+                # The next waiter is now first; let it check the bucket
+                condition.notify_all()
+
+        return time.monotonic() - started
 
     async def try_acquire(self, provider: str, tokens: float = 1.0) -> bool:
         """Try to acquire tokens without waiting.
@@ -140,22 +187,14 @@ class RateLimiter:
         Returns:
             True if tokens were acquired, False otherwise
         """
-        lock = await self._get_lock(provider)
-
-        async with lock:
-            if provider not in self._buckets:
-                return True
-
-            bucket = self._buckets[provider]
-            now = time.monotonic()
-            available = bucket.get_available_tokens(now)
-
-            if available >= tokens:
-                bucket.tokens = available - tokens
-                bucket.last_update = now
-                return True
+        bucket = self._buckets.get(provider)
+        if bucket is None:
+            return True
 
+        # Tokens are reserved for queued waiters first
+        if self._waiters.get(provider):
             return False
+        return self._try_consume(bucket, tokens) == 0.0
 
     async def report_rate_limit(
         self,
@@ -170,31 +209,28 @@ class RateLimiter:
             provider: Provider name
             retry_after: Retry-After header value in seconds
         """
-        lock = await self._get_lock(provider)
-
-        async with lock:
-            if provider not in self._buckets:
-                return
-
-            bucket = self._buckets[provider]
+        bucket = self._buckets.get(provider)
+        if bucket is None:
+            return
 
-            # Reduce adaptive factor (slow down requests)
-            bucket.adaptive_factor = max(0.1, bucket.adaptive_factor * 0.5)
+        # Reduce adaptive factor (slow down requests)
+        bucket.set_adaptive_factor(max(0.1, bucket.adaptive_factor * 0.5))
 
-            # Clear tokens
-            bucket.tokens = 0
-            bucket.last_update = time.monotonic()
+        # Clear tokens
+        bucket.tokens = 0
+        bucket.last_update = time.monotonic()
 
-            logger.warning(
-                "Rate limit reported, reducing throughput",
-                provider=provider,
-                adaptive_factor=bucket.adaptive_factor,
-                retry_after=retry_after,
-            )
+        logger.warning(
+            "Rate limit reported, reducing throughput",
+            provider=provider,
+            adaptive_factor=bucket.adaptive_factor,
+            retry_after=retry_after,
+        )
 
-            # If retry_after provided, wait that long
-            if retry_after and retry_after > 0:
-                await asyncio.sleep(retry_after)
+        # If retry_after provided, wait that long. No lock is held, so other
+        # callers (and their waits) are not blocked in the meantime.
+        if retry_after and retry_after > 0:
+            await asyncio.sleep(retry_after)
 
     async def report_success(self, provider: str) -> None:
         """Report a successful request.
@@ -204,17 +240,17 @@ class RateLimiter:
         Args:
             provider: Provider name
         """
-        lock = await self._get_lock(provider)
-
-        async with lock:
-            if provider not in self._buckets:
-                return
+        bucket = self._buckets.get(provider)
+        if bucket is None or bucket.adaptive_factor >= 1.0:
+            return
 
-            bucket = self._buckets[provider]
+        # Gradually restore adaptive factor
+        bucket.set_adaptive_factor(min(1.0, bucket.adaptive_factor * 1.1))
 
-            # Gradually restore adaptive factor
-            if bucket.adaptive_factor < 1.0:
-                bucket.adaptive_factor = min(1.0, bucket.adaptive_factor * 1.1)
+        # Waiters computed their wait at the old rate; let them recompute
+        condition = self._get_condition(provider)
+        async with condition:
+            condition.notify_all()
 
     def get_status(self, provider: str) -> dict | None:
         """Get current rate limit status for a provider.
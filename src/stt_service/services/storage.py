@@ -1,11 +1,14 @@
 """S3 Storage service for file operations."""
 
+import asyncio
 import io
-import json
-from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, BinaryIO
+import time
+import weakref
+from typing import Any, AsyncIterator, BinaryIO
 
 import aioboto3
+import orjson
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
@@ -14,53 +17,130 @@ from stt_service.utils.exceptions import StorageError
 
 settings = get_settings()
 
+# Objects from this size up are transferred as concurrent multipart parts
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+MULTIPART_CONCURRENCY = 16
+# Most parts S3 accepts in one multipart upload
+MULTIPART_MAX_PARTS = 10_000
+# Largest object CopyObject can copy; bigger ones are copied in parts
+COPY_OBJECT_MAX_SIZE = 5 * 1024 * 1024 * 1024
+
+# Seconds a head_object result (existence and size) is reused
+HEAD_CACHE_TTL = 30.0
+# Most entries kept in each of the head and presigned URL caches
+CACHE_MAX_SIZE = 10_000
+
+# Most keys S3 accepts in one DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+# Most DeleteObjects requests in flight for one delete_files call
+DELETE_CONCURRENCY = 16
+
+
+def _cache_get(cache: dict[Any, tuple[float, Any]], key: Any) -> Any:
+    """Get an unexpired value from a TTL cache dict, or None."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del cache[key]
+        return None
+    return entry[1]
+
+
+def _cache_put(cache: dict[Any, tuple[float, Any]], key: Any, value: Any, ttl: float) -> None:
+    """Store a value in a TTL cache dict, evicting the oldest entry when full."""
+    cache.pop(key, None)
+    if len(cache) >= CACHE_MAX_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = (time.monotonic() + ttl, value)
+
 
 class StorageService:
     """Service for S3/MinIO storage operations."""
 
     def __init__(self) -> None:
         self._session = aioboto3.Session()
+        # Multipart transfers and batched deletes fan out up to 16 requests,
+        # well beyond botocore's default pool of 10 connections
+        max_pool_connections = max(50, settings.celery.worker_concurrency * 4)
         self._config = BotoConfig(
             signature_version="s3v4",
             retries={"max_attempts": 3, "mode": "adaptive"},
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=True,
+            connect_timeout=5,
+            read_timeout=60,
         )
-
-    @asynccontextmanager
-    async def _get_client(self) -> AsyncGenerator[Any, None]:
-        """Get an S3 client."""
-        async with self._session.client(
-            "s3",
-            endpoint_url=settings.s3.endpoint_url,
-            aws_access_key_id=settings.s3.access_key_id,
-            aws_secret_access_key=settings.s3.secret_access_key,
-            region_name=settings.s3.region,
-            config=self._config,
-        ) as client:
-            yield client
+        self._transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_CHUNKSIZE,
+            max_concurrency=MULTIPART_CONCURRENCY,
+        )
+        # Object sizes by key; entries are dropped when the key is written or deleted
+        self._head_cache: dict[str, tuple[float, int]] = {}
+        # Presigned URLs by (key, method, expiration), reused for half their lifetime
+        self._url_cache: dict[tuple[str, str, int], tuple[float, str]] = {}
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = weakref.WeakKeyDictionary()
+        self._locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = weakref.WeakKeyDictionary()
+
+    async def _get_client(self) -> Any:
+        """Get the S3 client of the running event loop.
+
+        Opening a client resolves credentials and starts a connection pool,
+        so it is done once per loop and reused by every call. The client is
+        bound to its loop, and the Celery worker runs each task in a fresh
+        one, so clients are kept per loop; close them with aclose().
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            lock = self._locks.setdefault(loop, asyncio.Lock())
+            async with lock:
+                client = self._clients.get(loop)
+                if client is None:
+                    client = await self._session.client(
+                        "s3",
+                        endpoint_url=settings.s3.endpoint_url,
+                        aws_access_key_id=settings.s3.access_key_id,
+                        aws_secret_access_key=settings.s3.secret_access_key,
+                        region_name=settings.s3.region,
+                        config=self._config,
+                    ).__aenter__()
+                    self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the S3 client of the running event loop, if one is open."""
+        loop = asyncio.get_running_loop()
+        self._locks.pop(loop, None)
+        client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.__aexit__(None, None, None)
 
     async def ensure_bucket_exists(self) -> None:
         """Ensure the bucket exists, create if not."""
-        async with self._get_client() as client:
-            try:
-                await client.head_bucket(Bucket=settings.s3.bucket_name)
-            except ClientError as e:
-                error_code = e.response.get("Error", {}).get("Code", "")
-                if error_code == "404":
-                    try:
-                        await client.create_bucket(
-                            Bucket=settings.s3.bucket_name,
-                            CreateBucketConfiguration={
-                                "LocationConstraint": settings.s3.region
-                            }
-                            if settings.s3.region != "us-east-1"
-                            else {},
-                        )
-                    except ClientError as create_error:
-                        raise StorageError(
-                            f"Failed to create bucket: {create_error}"
-                        ) from create_error
-                else:
-                    raise StorageError(f"Failed to check bucket: {e}") from e
+        client = await self._get_client()
+        try:
+            await client.head_bucket(Bucket=settings.s3.bucket_name)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if error_code == "404":
+                try:
+                    await client.create_bucket(
+                        Bucket=settings.s3.bucket_name,
+                        CreateBucketConfiguration={
+                            "LocationConstraint": settings.s3.region
+                        }
+                        if settings.s3.region != "us-east-1"
+                        else {},
+                    )
+                except ClientError as create_error:
+                    raise StorageError(
+                        f"Failed to create bucket: {create_error}"
+                    ) from create_error
+            else:
+                raise StorageError(f"Failed to check bucket: {e}") from e
 
     async def upload_file(
         self,
@@ -80,35 +160,47 @@ class StorageService:
         Returns:
             The S3 key of the uploaded file
         """
-        async with self._get_client() as client:
-            try:
-                extra_args: dict[str, Any] = {"ContentType": content_type}
-                if metadata:
-                    # Sanitize metadata - S3 only supports ASCII in metadata
-                    sanitized_metadata = {}
-                    for k, v in metadata.items():
-                        # URL-encode non-ASCII characters
-                        try:
-                            v.encode('ascii')
-                            sanitized_metadata[k] = v
-                        except UnicodeEncodeError:
-                            # Use URL encoding for non-ASCII values
-                            from urllib.parse import quote
-                            sanitized_metadata[k] = quote(v, safe='')
-                    extra_args["Metadata"] = sanitized_metadata
-
-                if isinstance(data, bytes):
-                    data = io.BytesIO(data)
-
-                await client.upload_fileobj(
-                    data,
-                    settings.s3.bucket_name,
-                    key,
-                    ExtraArgs=extra_args,
-                )
-                return key
-            except ClientError as e:
-                raise StorageError(f"Failed to upload file: {e}") from e
+        client = await self._get_client()
+        try:
+            extra_args: dict[str, Any] = {"ContentType": content_type}
+            if metadata:
+                # Sanitize metadata - S3 only supports ASCII in metadata
+                sanitized_metadata = {}
+                for k, v in metadata.items():
+                    # URL-encode non-ASCII characters
+                    try:
+                        v.encode('ascii')
+                        sanitized_metadata[k] = v
+                    except UnicodeEncodeError:
+                        # Use URL encoding for non-ASCII values
+                        from urllib.parse import quote
+                        sanitized_metadata[k] = quote(v, safe='')
+                extra_args["Metadata"] = sanitized_metadata
+
+            if isinstance(data, bytes):
+                if len(data) < MULTIPART_THRESHOLD:
+                    # One PUT request, without the transfer manager's chunking
+                    await client.put_object(
+                        Bucket=settings.s3.bucket_name,
+                        Key=key,
+                        Body=data,
+                        **extra_args,
+                    )
+                    return key
+                data = io.BytesIO(data)
+
+            await client.upload_fileobj(
+                data,
+                settings.s3.bucket_name,
+                key,
+                ExtraArgs=extra_args,
+                Config=self._transfer_config,
+            )
+            return key
+        except ClientError as e:
+            raise StorageError(f"Failed to upload file: {e}") from e
+        finally:
+            self._head_cache.pop(key, None)
 
     async def download_file(self, key: str) -> bytes:
         """Download a file from S3.
@@ -119,18 +211,19 @@ class StorageService:
         Returns:
             File content as bytes
         """
-        async with self._get_client() as client:
-            try:
-                buffer = io.BytesIO()
-                await client.download_fileobj(
-                    settings.s3.bucket_name,
-                    key,
-                    buffer,
-                )
-                buffer.seek(0)
-                return buffer.read()
-            except ClientError as e:
-                raise StorageError(f"Failed to download file: {e}") from e
+        client = await self._get_client()
+        try:
+            buffer = io.BytesIO()
+            await client.download_fileobj(
+                settings.s3.bucket_name,
+                key,
+                buffer,
+                Config=self._transfer_config,
+            )
+            # getvalue() hands over the buffer without the copy read() makes
+            return buffer.getvalue()
+        except ClientError as e:
+            raise StorageError(f"Failed to download file: {e}") from e
 
     async def download_file_to_path(self, key: str, local_path: str) -> str:
         """Download a file from S3 to a local path.
@@ -142,65 +235,170 @@ class StorageService:
         Returns:
             Local file path
         """
-        async with self._get_client() as client:
-            try:
-                await client.download_file(
-                    settings.s3.bucket_name,
-                    key,
-                    local_path,
+        client = await self._get_client()
+        try:
+            await client.download_file(
+                settings.s3.bucket_name,
+                key,
+                local_path,
+                Config=self._transfer_config,
+            )
+            return local_path
+        except ClientError as e:
+            raise StorageError(f"Failed to download file: {e}") from e
+
+    async def copy_file(self, src_key: str, dst_key: str) -> str:
+        """Copy a file within the bucket without downloading it.
+
+        Objects up to 5 GiB are copied with one CopyObject request, larger
+        ones with concurrent UploadPartCopy requests, so the data never
+        passes through this process.
+
+        Args:
+            src_key: S3 key of the source object
+            dst_key: S3 key of the copy
+
+        Returns:
+            The S3 key of the copy
+        """
+        client = await self._get_client()
+        copy_source = {"Bucket": settings.s3.bucket_name, "Key": src_key}
+        try:
+            head = await client.head_object(Bucket=settings.s3.bucket_name, Key=src_key)
+            if head["ContentLength"] <= COPY_OBJECT_MAX_SIZE:
+                await client.copy_object(
+                    Bucket=settings.s3.bucket_name,
+                    Key=dst_key,
+                    CopySource=copy_source,
                 )
-                return local_path
-            except ClientError as e:
-                raise StorageError(f"Failed to download file: {e}") from e
+            else:
+                await self._multipart_copy(client, copy_source, dst_key, head)
+            return dst_key
+        except ClientError as e:
+            raise StorageError(f"Failed to copy file: {e}") from e
+        finally:
+            self._head_cache.pop(dst_key, None)
+
+    async def _multipart_copy(
+        self,
+        client: Any,
+        copy_source: dict[str, str],
+        dst_key: str,
+        head: dict[str, Any],
+    ) -> None:
+        """Copy an object in byte ranges with UploadPartCopy."""
+        size = head["ContentLength"]
+        # Parts grow beyond the default size when needed to stay within the part limit
+        part_size = max(MULTIPART_CHUNKSIZE, -(-size // MULTIPART_MAX_PARTS))
+        upload = await client.create_multipart_upload(
+            Bucket=settings.s3.bucket_name,
+            Key=dst_key,
+            ContentType=head.get("ContentType", "application/octet-stream"),
+            Metadata=head.get("Metadata", {}),
+        )
+        upload_id = upload["UploadId"]
+        semaphore = asyncio.Semaphore(MULTIPART_CONCURRENCY)
 
-    async def delete_file(self, key: str) -> None:
-        """Delete a file from S3."""
-        async with self._get_client() as client:
-            try:
-                await client.delete_object(
+        async def copy_part(part_number: int, first_byte: int) -> dict[str, Any]:
+            last_byte = min(first_byte + part_size, size) - 1
+            async with semaphore:
+                response = await client.upload_part_copy(
                     Bucket=settings.s3.bucket_name,
-                    Key=key,
+                    Key=dst_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    CopySource=copy_source,
+                    CopySourceRange=f"bytes={first_byte}-{last_byte}",
                 )
-            except ClientError as e:
-                raise StorageError(f"Failed to delete file: {e}") from e
+            return {"PartNumber": part_number, "ETag": response["CopyPartResult"]["ETag"]}
+
+        try:
+            parts = await asyncio.gather(*(
+                copy_part(part_number, first_byte)
+                for part_number, first_byte in enumerate(range(0, size, part_size), start=1)
+            ))
+            await client.complete_multipart_upload(
+                Bucket=settings.s3.bucket_name,
+                Key=dst_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            # Uploaded parts are billed until the upload is aborted
+            await client.abort_multipart_upload(
+                Bucket=settings.s3.bucket_name,
+                Key=dst_key,
+                UploadId=upload_id,
+            )
+            raise
+
+    async def delete_file(self, key: str) -> None:
+        """Delete a file from S3."""
+        client = await self._get_client()
+        try:
+            await client.delete_object(
+                Bucket=settings.s3.bucket_name,
+                Key=key,
+            )
+        except ClientError as e:
+            raise StorageError(f"Failed to delete file: {e}") from e
+        finally:
+            self._head_cache.pop(key, None)
 
     async def delete_files(self, keys: list[str]) -> None:
         """Delete multiple files from S3."""
         if not keys:
             return
 
-        async with self._get_client() as client:
-            try:
+        client = await self._get_client()
+        # DeleteObjects accepts at most 1000 keys per request
+        semaphore = asyncio.Semaphore(DELETE_CONCURRENCY)
+
+        async def delete_batch(batch: list[str]) -> None:
+            async with semaphore:
                 await client.delete_objects(
                     Bucket=settings.s3.bucket_name,
-                    Delete={"Objects": [{"Key": key} for key in keys]},
+                    Delete={"Objects": [{"Key": key} for key in batch]},
                 )
-            except ClientError as e:
-                raise StorageError(f"Failed to delete files: {e}") from e
+
+        try:
+            await asyncio.gather(*(
+                delete_batch(keys[i:i + DELETE_BATCH_SIZE])
+                for i in range(0, len(keys), DELETE_BATCH_SIZE)
+            ))
+        except ClientError as e:
+            raise StorageError(f"Failed to delete files: {e}") from e
+        finally:
+            for key in keys:
+                self._head_cache.pop(key, None)
+
+    async def _head_size(self, key: str) -> int:
+        """Get the size of an object, from the head cache when possible."""
+        size = _cache_get(self._head_cache, key)
+        if size is None:
+            client = await self._get_client()
+            response = await client.head_object(
+                Bucket=settings.s3.bucket_name,
+                Key=key,
+            )
+            size = response["ContentLength"]
+            _cache_put(self._head_cache, key, size, HEAD_CACHE_TTL)
+        return size
 
     async def file_exists(self, key: str) -> bool:
         """Check if a file exists in S3."""
-        async with self._get_client() as client:
-            try:
-                await client.head_object(
-                    Bucket=settings.s3.bucket_name,
-                    Key=key,
-                )
-                return True
-            except ClientError:
-                return False
+        try:
+            await self._head_size(key)
+            return True
+        except ClientError:
+            return False
 
     async def get_file_size(self, key: str) -> int:
         """Get the size of a file in S3."""
-        async with self._get_client() as client:
-            try:
-                response = await client.head_object(
-                    Bucket=settings.s3.bucket_name,
-                    Key=key,
-                )
-                return response["ContentLength"]
-            except ClientError as e:
-                raise StorageError(f"Failed to get file size: {e}") from e
+        try:
+            return await self._head_size(key)
+        except ClientError as e:
+            raise StorageError(f"Failed to get file size: {e}") from e
 
     async def generate_presigned_url(
         self,
@@ -221,19 +419,62 @@ class StorageService:
         if expiration is None:
             expiration = settings.s3.presigned_url_expiration
 
-        async with self._get_client() as client:
-            try:
-                url = await client.generate_presigned_url(
-                    method,
-                    Params={
-                        "Bucket": settings.s3.bucket_name,
-                        "Key": key,
-                    },
-                    ExpiresIn=expiration,
-                )
-                return url
-            except ClientError as e:
-                raise StorageError(f"Failed to generate presigned URL: {e}") from e
+        cache_key = (key, method, expiration)
+        url = _cache_get(self._url_cache, cache_key)
+        if url is not None:
+            return url
+
+        client = await self._get_client()
+        try:
+            url = await client.generate_presigned_url(
+                method,
+                Params={
+                    "Bucket": settings.s3.bucket_name,
+                    "Key": key,
+                },
+                ExpiresIn=expiration,
+            )
+            # A cached URL stays valid for at least half its lifetime
+            _cache_put(self._url_cache, cache_key, url, expiration / 2)
+            return url
+        except ClientError as e:
+            raise StorageError(f"Failed to generate presigned URL: {e}") from e
+
+    async def iter_files(
+        self,
+        prefix: str,
+        page_size: int = 1000,
+        max_items: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over the files with a given prefix, one listing page at a time.
+
+        Args:
+            prefix: S3 key prefix
+            page_size: Keys requested per ListObjectsV2 call
+            max_items: Stop after this many files (None for all)
+
+        Yields:
+            File metadata dicts
+        """
+        client = await self._get_client()
+        paginator = client.get_paginator("list_objects_v2")
+        pagination_config: dict[str, int] = {"PageSize": page_size}
+        if max_items is not None:
+            pagination_config["MaxItems"] = max_items
+        try:
+            async for page in paginator.paginate(
+                Bucket=settings.s3.bucket_name,
+                Prefix=prefix,
+                PaginationConfig=pagination_config,
+            ):
+                for obj in page.get("Contents", []):
+                    yield {
+                        "key": obj["Key"],
+                        "size": obj["Size"],
+                        "last_modified": obj["LastModified"],
+                    }
+        except ClientError as e:
+            raise StorageError(f"Failed to list files: {e}") from e
 
     async def list_files(
         self,
@@ -249,23 +490,7 @@ class StorageService:
         Returns:
             List of file metadata dicts
         """
-        async with self._get_client() as client:
-            try:
-                response = await client.list_objects_v2(
-                    Bucket=settings.s3.bucket_name,
-                    Prefix=prefix,
-                    MaxKeys=max_keys,
-                )
-                return [
-                    {
-                        "key": obj["Key"],
-                        "size": obj["Size"],
-                        "last_modified": obj["LastModified"],
-                    }
-                    for obj in response.get("Contents", [])
-                ]
-            except ClientError as e:
-                raise StorageError(f"Failed to list files: {e}") from e
+        return [f async for f in self.iter_files(prefix, min(max_keys, 1000), max_keys)]
 
     async def upload_json(self, key: str, data: dict[str, Any]) -> str:
         """Upload JSON data to S3.
@@ -277,7 +502,8 @@ class StorageService:
         Returns:
             S3 key
         """
-        json_bytes = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        # orjson writes compact UTF-8 bytes directly, without an str round trip
+        json_bytes = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
         return await self.upload_file(
             key,
             json_bytes,
@@ -294,7 +520,7 @@ class StorageService:
             Parsed JSON dict
         """
         data = await self.download_file(key)
-        return json.loads(data.decode("utf-8"))
+        return orjson.loads(data)
 
     @staticmethod
     def generate_job_key(job_id: str, filename: str) -> str:
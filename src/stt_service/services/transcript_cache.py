@@ -0,0 +1,95 @@
+"""On-disk cache of provider transcription responses.
+
+Re-transcribing the same audio with the same request (reprocessing a job,
+coverage retries, local development) otherwise re-hits the provider API,
+spending both wall-clock time and tokens. Entries are stored as one JSON
+file per key under the configured directory.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from stt_service.providers.base import TranscriptionResponse
+
+logger = structlog.get_logger()
+
+
+class TranscriptCache:
+    """Directory-of-JSON cache keyed by audio hash and request fingerprint."""
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def make_key(audio_data: bytes, *fingerprint: Any) -> str:
+        """Build a cache key from the audio bytes and request parameters.
+
+        Args:
+            audio_data: Raw audio bytes sent to the provider
+            *fingerprint: Everything else that affects the provider output
+                (model, generation settings, prompt, ...)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        audio_digest = hashlib.sha256(audio_data).hexdigest()
+        params = json.dumps(fingerprint, sort_keys=True, default=str)
+        params_digest = hashlib.sha256(params.encode("utf-8")).hexdigest()
+        return f"{audio_digest[:32]}{params_digest[:32]}"
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> "TranscriptionResponse | None":
+        """Return the cached response for a key, or None on miss."""
+        from stt_service.providers.base import TranscriptionResponse, TranscriptionSegment
+
+        path = self._path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable transcript cache entry", path=str(path), error=str(e))
+            return None
+
+        return TranscriptionResponse(
+            text=payload["text"],
+            segments=[TranscriptionSegment(**seg) for seg in payload["segments"]],
+            language_detected=payload.get("language_detected"),
+            metadata=payload.get("metadata") or {},
+            processing_time_ms=payload.get("processing_time_ms"),
+        )
+
+    def put(self, key: str, response: "TranscriptionResponse") -> None:
+        """Store a response. Write failures are logged and otherwise ignored."""
+        path = self._path(key)
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see partial JSON
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(asdict(response), f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            # A cache failure must never fail the transcription itself
+            logger.warning("Failed to write transcript cache entry", path=str(path), error=str(e))
+            if tmp_path:
+                Path(tmp_path).unlink(missing_ok=True)
+
+
+def get_transcript_cache() -> TranscriptCache | None:
+    """Get the configured transcript cache, or None when caching is disabled."""
+    from stt_service.config import get_settings
+
+    cache_dir = get_settings().transcript_cache_dir
+    return TranscriptCache(cache_dir) if cache_dir else None
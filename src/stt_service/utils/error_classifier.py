@@ -1,5 +1,7 @@
 """Classify provider exceptions into user-friendly error codes."""
 
+import re
+
 from stt_service.utils.exceptions import ProviderError, RateLimitError
 
 
@@ -18,6 +20,30 @@ _AUTH_PATTERNS = ("401", "403", "unauthorized", "forbidden", "invalid api key",
 _AUDIO_PATTERNS = ("invalid audio", "unsupported format", "corrupt", "could not decode", "bad request")
 _UNAVAILABLE_PATTERNS = ("503", "502", "service unavailable", "bad gateway", "connection refused", "connection reset")
 _QUOTA_PATTERNS = ("quota", "billing", "payment required", "402")
+_RATE_LIMIT_PATTERNS = ("429", "resource exhausted", "resourceexhausted")
+
+_PATTERN_TO_CODE = {
+    pattern: code
+    for code, patterns in (
+        (ERROR_TIMEOUT, _TIMEOUT_PATTERNS),
+        (ERROR_AUTH, _AUTH_PATTERNS),
+        (ERROR_INVALID_AUDIO, _AUDIO_PATTERNS),
+        (ERROR_PROVIDER_UNAVAILABLE, _UNAVAILABLE_PATTERNS),
+        (ERROR_QUOTA_EXCEEDED, _QUOTA_PATTERNS),
+        (ERROR_RATE_LIMITED, _RATE_LIMIT_PATTERNS),
+    )
+    for pattern in patterns
+}
+# One alternation finds every pattern in a single pass over the message. The
+# lookahead makes matches zero-width, so overlapping patterns are all found.
+_PATTERN_RE = re.compile(
+    "(?=(" + "|".join(re.escape(p) for p in sorted(_PATTERN_TO_CODE, key=len, reverse=True)) + "))"
+)
+
+
+def _matched_codes(msg_lower: str) -> set[str]:
+    """Get the error codes of every pattern found in a lowercase message."""
+    return {_PATTERN_TO_CODE[m.group(1)] for m in _PATTERN_RE.finditer(msg_lower)}
 
 
 def classify_error(exc: Exception) -> tuple[str, str]:
@@ -34,53 +60,52 @@ def classify_error(exc: Exception) -> tuple[str, str]:
             "Please try again in a few minutes."
         )
 
+    matched = _matched_codes(str(exc).lower())
+
     if isinstance(exc, ProviderError) and not exc.retryable:
-        msg_lower = str(exc).lower()
-        if any(p in msg_lower for p in _AUTH_PATTERNS):
+        if ERROR_AUTH in matched:
             return ERROR_AUTH, (
                 "Authentication with the transcription provider failed. "
                 "Please check provider API key configuration."
             )
-        if any(p in msg_lower for p in _AUDIO_PATTERNS):
+        if ERROR_INVALID_AUDIO in matched:
             return ERROR_INVALID_AUDIO, (
                 "The audio file could not be processed by the provider. "
                 "It may be corrupted or in an unsupported format."
             )
 
     # Fall back to string matching on any exception
-    msg_lower = str(exc).lower()
-
-    if any(p in msg_lower for p in _TIMEOUT_PATTERNS):
+    if ERROR_TIMEOUT in matched:
         return ERROR_TIMEOUT, (
             "The transcription request timed out. "
             "This can happen with very long audio files. Please try again."
         )
 
-    if "429" in msg_lower or "resource exhausted" in msg_lower or "resourceexhausted" in msg_lower:
+    if ERROR_RATE_LIMITED in matched:
         return ERROR_RATE_LIMITED, (
             "The transcription provider is temporarily rate-limiting requests. "
             "Please try again in a few minutes."
         )
 
-    if any(p in msg_lower for p in _QUOTA_PATTERNS):
+    if ERROR_QUOTA_EXCEEDED in matched:
         return ERROR_QUOTA_EXCEEDED, (
             "The provider API quota has been exceeded. "
             "Please contact the administrator."
         )
 
-    if any(p in msg_lower for p in _AUTH_PATTERNS):
+    if ERROR_AUTH in matched:
         return ERROR_AUTH, (
             "Authentication with the transcription provider failed. "
             "Please check provider API key configuration."
         )
 
-    if any(p in msg_lower for p in _AUDIO_PATTERNS):
+    if ERROR_INVALID_AUDIO in matched:
         return ERROR_INVALID_AUDIO, (
             "The audio file could not be processed by the provider. "
             "It may be corrupted or in an unsupported format."
         )
 
-    if any(p in msg_lower for p in _UNAVAILABLE_PATTERNS):
+    if ERROR_PROVIDER_UNAVAILABLE in matched:
         return ERROR_PROVIDER_UNAVAILABLE, (
             "The transcription provider is currently unavailable. "
             "Please try again later."
@@ -4,6 +4,8 @@ Verifies that uploaded files are actual audio/video, not arbitrary
 data with a renamed extension.
 """
 
+from collections import defaultdict
+
 # Magic byte signatures for supported media formats.
 # Each entry is (offset, signature_bytes, description).
 # A file matches if ANY signature matches.
@@ -44,6 +46,18 @@ _SIGNATURES: list[tuple[int, bytes, str]] = [
 _MIN_HEADER_SIZE = 12
 
 
+def _group_signatures() -> dict[tuple[int, int], frozenset[bytes]]:
+    """Group signatures by the (offset, length) of the header slice they match."""
+    groups: defaultdict[tuple[int, int], set[bytes]] = defaultdict(set)
+    for offset, signature, _desc in _SIGNATURES:
+        groups[(offset, len(signature))].add(signature)
+    return {key: frozenset(signatures) for key, signatures in groups.items()}
+
+
+# Each distinct header slice is extracted once and looked up in a set
+_SIGNATURES_BY_SLICE = _group_signatures()
+
+
 def is_valid_media_file(data: bytes) -> bool:
     """Check if the file data starts with a known audio/video signature.
 
@@ -56,9 +70,8 @@ def is_valid_media_file(data: bytes) -> bool:
     if len(data) < _MIN_HEADER_SIZE:
         return False
 
-    for offset, signature, _desc in _SIGNATURES:
-        end = offset + len(signature)
-        if end <= len(data) and data[offset:end] == signature:
-            return True
-
-    return False
+    # Every signature ends within _MIN_HEADER_SIZE, so no slice runs short
+    return any(
+        data[offset:offset + length] in signatures
+        for (offset, length), signatures in _SIGNATURES_BY_SLICE.items()
+    )
@@ -1,13 +1,36 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
 
+import orjson
 import structlog
 from stt_service.config import get_settings
 
+# Set once logging is configured. The API and the Celery worker (at import and
+# again from its setup_logging signal) may both call configure_logging, and
+# each call would otherwise attach another file handler.
+_configured = False
+# Thread writing queued records to the log file, one per process
+_listener: logging.handlers.QueueListener | None = None
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """JSONRenderer serializer; stdlib logging handlers expect str, not bytes."""
+    return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
 def configure_logging():
-    """Configure structlog for both console and file output."""
+    """Configure structlog for both console and file output.
+
+    Only the first call has an effect.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
     settings = get_settings()
     
     # Ensure log directory exists
@@ -24,6 +47,8 @@ def configure_logging():
 
     # Define processors
     processors = [
+        # Drop events below the configured level before any rendering work
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
@@ -33,7 +58,7 @@ def configure_logging():
     ]
 
     if settings.log_format == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
     else:
         processors.append(structlog.dev.ConsoleRenderer())
 
@@ -51,16 +76,39 @@ def configure_logging():
         cache_logger_on_first_use=True,
     )
 
-    # Add file handler to root logger to capture everything
+    # Add file handler to root logger to capture everything. The file is
+    # written by a listener thread, so logging calls only enqueue the record
+    # instead of blocking the event loop on a disk write.
     try:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s'))
-        logging.getLogger().addHandler(file_handler)
+        queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        _start_listener(queue_handler, file_handler)
+        atexit.register(_stop_listener)
+        # Threads do not survive fork (Celery prefork workers); each child
+        # process starts its own listener on a fresh queue
+        os.register_at_fork(after_in_child=lambda: _start_listener(queue_handler, file_handler))
+        logging.getLogger().addHandler(queue_handler)
     except Exception as e:
         print(f"Warning: Could not initialize file logging: {e}", file=sys.stderr)
     
-    # Set levels for noisy libraries
-    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO) # Keep SQL logs as requested
+    # Set levels for noisy libraries. SQL logs are kept outside production.
+    sql_level = logging.WARNING if settings.environment == "production" else logging.INFO
+    logging.getLogger("sqlalchemy.engine").setLevel(sql_level)
+
+
+def _start_listener(queue_handler: logging.handlers.QueueHandler, file_handler: logging.Handler) -> None:
+    """Point the queue handler at a new queue drained by a new listener thread."""
+    global _listener
+    queue_handler.queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(queue_handler.queue, file_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    """Flush queued records to the log file and stop this process's listener."""
+    if _listener is not None:
+        _listener.stop()
 
 from contextlib import contextmanager
 
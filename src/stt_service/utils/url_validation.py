@@ -2,6 +2,7 @@
 
 import ipaddress
 import socket
+import time
 from urllib.parse import urlparse
 
 _BLOCKED_NETWORKS = [
@@ -16,6 +17,70 @@ _BLOCKED_NETWORKS = [
     ipaddress.ip_network("fe80::/10"),          # IPv6 link-local
 ]
 
+# Bits of the address prefix used to bucket blocked ranges, per IP version
+_V4_BUCKET_SHIFT = 32 - 8
+_V6_BUCKET_SHIFT = 128 - 16
+
+
+def _bucket_blocked_networks(version: int, shift: int) -> dict[int, tuple[tuple[int, int], ...]]:
+    """Map each address prefix to the blocked (first, last) ranges overlapping it.
+
+    An address then only needs comparing against the ranges of its own
+    prefix, which for most public addresses is none.
+    """
+    buckets: dict[int, list[tuple[int, int]]] = {}
+    for net in _BLOCKED_NETWORKS:
+        if net.version != version:
+            continue
+        lo, hi = int(net.network_address), int(net.broadcast_address)
+        for prefix in range(lo >> shift, (hi >> shift) + 1):
+            buckets.setdefault(prefix, []).append((lo, hi))
+    return {prefix: tuple(ranges) for prefix, ranges in buckets.items()}
+
+
+_BLOCKED_V4 = _bucket_blocked_networks(4, _V4_BUCKET_SHIFT)
+_BLOCKED_V6 = _bucket_blocked_networks(6, _V6_BUCKET_SHIFT)
+
+# Validation runs inside request handling, where getaddrinfo blocks the event
+# loop; successful resolutions are reused for this many seconds
+_DNS_CACHE_TTL = 60.0
+_DNS_CACHE_MAX_SIZE = 1024
+_dns_cache: dict[str, tuple[float, list[str]]] = {}
+
+
+def _resolve(hostname: str) -> list[str]:
+    """Resolve a hostname to its IP addresses, using the TTL cache.
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved (not cached).
+    """
+    now = time.monotonic()
+    cached = _dns_cache.pop(hostname, None)
+    if cached is not None and cached[0] > now:
+        _dns_cache[hostname] = cached
+        return cached[1]
+
+    infos = socket.getaddrinfo(hostname, None, proto=socket.IPPROTO_TCP)
+    addresses = [sockaddr[0] for _family, _type, _proto, _canonname, sockaddr in infos]
+
+    if len(_dns_cache) >= _DNS_CACHE_MAX_SIZE:
+        # Evict the least recently used entry
+        del _dns_cache[next(iter(_dns_cache))]
+    _dns_cache[hostname] = (now + _DNS_CACHE_TTL, addresses)
+    return addresses
+
+
+def _is_blocked(address: str) -> bool:
+    """Check whether a resolved IP address lies in a blocked network."""
+    if ":" in address:
+        # Drop the zone index of scoped link-local addresses ("fe80::1%eth0")
+        ip_int = int.from_bytes(socket.inet_pton(socket.AF_INET6, address.partition("%")[0]), "big")
+        ranges = _BLOCKED_V6.get(ip_int >> _V6_BUCKET_SHIFT, ())
+    else:
+        ip_int = int.from_bytes(socket.inet_pton(socket.AF_INET, address), "big")
+        ranges = _BLOCKED_V4.get(ip_int >> _V4_BUCKET_SHIFT, ())
+    return any(lo <= ip_int <= hi for lo, hi in ranges)
+
 
 def validate_external_url(url: str) -> str:
     """Validate that a URL is safe to make requests to.
@@ -47,16 +112,14 @@ def validate_external_url(url: str) -> str:
 
     # Resolve hostname to IP and check against blocked ranges
     try:
-        infos = socket.getaddrinfo(hostname, None, proto=socket.IPPROTO_TCP)
+        addresses = _resolve(hostname)
     except socket.gaierror:
         raise ValueError(f"Cannot resolve hostname: {hostname}")
 
-    for _family, _type, _proto, _canonname, sockaddr in infos:
-        ip = ipaddress.ip_address(sockaddr[0])
-        for network in _BLOCKED_NETWORKS:
-            if ip in network:
-                raise ValueError(
-                    f"URL resolves to blocked address: {ip}"
-                )
+    for address in addresses:
+        if _is_blocked(address):
+            raise ValueError(
+                f"URL resolves to blocked address: {address}"
+            )
 
     return url
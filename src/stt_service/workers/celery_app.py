@@ -11,7 +11,7 @@ from stt_service.utils.logging_config import configure_logging
 def setup_celery_logging(**kwargs):
     configure_logging()
 
-# Also run it immediately for import time
+# Also run it immediately for import time (later calls are no-ops)
 configure_logging()
 
 settings = get_settings()
@@ -5,6 +5,7 @@ import json
 import os
 import shutil
 import tempfile
+from pathlib import Path
 from typing import Any
 
 import httpx
@@ -20,6 +21,7 @@ from stt_service.db.repositories.job import JobRepository
 from stt_service.db.session import get_db_context
 from stt_service.utils.logging_config import job_logging_context
 from stt_service.providers import TranscriptionConfig, get_provider
+from stt_service.providers.http import close_shared_clients
 from stt_service.services.rate_limiter import setup_default_limits
 from stt_service.services.storage import storage_service
 from stt_service.workers.celery_app import celery_app
@@ -37,6 +39,9 @@ def run_async(coro):
     try:
         return loop.run_until_complete(coro)
     finally:
+        # Provider HTTP clients and the S3 client are per loop; close them with it
+        loop.run_until_complete(close_shared_clients())
+        loop.run_until_complete(storage_service.aclose())
         loop.close()
 
 
@@ -108,10 +113,16 @@ async def _process_transcription_job(task, job_id: str) -> dict[str, Any]:
                 duration=job_duration_seconds,
             )
 
-            # Download audio file (no DB needed)
+            provider = get_provider(provider_name)
+
+            # Download audio file (no DB needed), warming up the provider
+            # connection in the meantime
             with tempfile.TemporaryDirectory() as temp_dir:
                 audio_path = os.path.join(temp_dir, "audio")
-                await storage_service.download_file_to_path(job_s3_key, audio_path)
+                await asyncio.gather(
+                    storage_service.download_file_to_path(job_s3_key, audio_path),
+                    provider.warm_up(),
+                )
 
                 # Chunking stage (no DB needed)
                 logger.info("="*50 + "\n>>> STAGE: AUDIO CHUNKER <<<\n" + "="*50)
@@ -176,7 +187,6 @@ async def _process_transcription_job(task, job_id: str) -> dict[str, Any]:
 
                 # Process chunks (provider API calls — the expensive part)
                 logger.info("="*50 + f"\n>>> STAGE: PROVIDER PROCESSING ({provider_name.upper()}) <<<\n" + "="*50)
-                provider = get_provider(provider_name)
                 base_config = _build_transcription_config(job_config)
                 results = []
 
@@ -435,10 +445,10 @@ async def _process_single_chunk(
     on_retry: Any = None,
 ) -> dict[str, Any]:
     """Process a single audio chunk with retry logic."""
+    # Read once, off the event loop; every retry attempt reuses the bytes
+    audio_data = await asyncio.to_thread(Path(chunk.file_path).read_bytes)
 
     async def do_transcribe():
-        with open(chunk.file_path, "rb") as f:
-            audio_data = f.read()
         return await provider.transcribe(audio_data, config)
 
     result = await retry_with_backoff(
@@ -903,8 +913,8 @@ async def _cleanup_expired_jobs() -> dict[str, Any]:
 
             # List and delete chunk files under jobs/{job_id}/
             try:
-                prefix_files = await storage_service.list_files(f"jobs/{job.id}/")
-                s3_keys.extend(f["key"] for f in prefix_files)
+                async for f in storage_service.iter_files(f"jobs/{job.id}/"):
+                    s3_keys.append(f["key"])
             except Exception as e:
                 logger.warning("Failed to list S3 files for cleanup", job_id=job.id, error=str(e))
 
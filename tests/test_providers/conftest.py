@@ -0,0 +1,13 @@
+"""Shared fixtures for provider tests."""
+
+import pytest
+
+from stt_service.providers import wav
+
+
+@pytest.fixture(autouse=True)
+def clear_wav_project_ids():
+    """Keep resolved wav.am project IDs from leaking between tests."""
+    wav._project_ids.clear()
+    yield
+    wav._project_ids.clear()
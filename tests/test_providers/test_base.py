@@ -0,0 +1,18 @@
+"""Tests for shared provider helpers."""
+
+import pytest
+
+from stt_service.providers.base import as_float
+
+
+class TestAsFloat:
+
+    @pytest.mark.parametrize("value, expected", [(1.5, 1.5), (2, 2.0), ("3.25", 3.25), (None, 0.0)])
+    def test_conversion(self, value, expected):
+        result = as_float(value)
+
+        assert result == expected
+        assert type(result) is float
+
+    def test_custom_default(self):
+        assert as_float(None, default=-1.0) == -1.0
@@ -0,0 +1,118 @@
+"""Tests for GeminiProvider transcript cache wiring."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from stt_service.config import get_settings
+from stt_service.providers.base import TranscriptionConfig
+from stt_service.providers.gemini import GeminiProvider
+from stt_service.services.transcript_cache import TranscriptCache
+
+_SEGMENTS_JSON = json.dumps(
+    {"segments": [{"speaker": "SPEAKER_00", "start": 0.0, "end": 2.0, "text": "Barev"}]}
+)
+
+
+def _fake_response(text: str, finish_reason: int = 1) -> SimpleNamespace:
+    """Minimal stand-in for a google-generativeai response object."""
+    return SimpleNamespace(
+        text=text,
+        candidates=[SimpleNamespace(finish_reason=finish_reason)],
+        usage_metadata=SimpleNamespace(prompt_token_count=100, candidates_token_count=20),
+    )
+
+
+@pytest.fixture
+def config():
+    return TranscriptionConfig(language="hy", audio_duration=10.0)
+
+
+@pytest.fixture
+def provider(tmp_path):
+    """GeminiProvider with a mocked model and a cache in a temp directory."""
+    provider = GeminiProvider(api_key="test-key")
+    provider._cache = TranscriptCache(tmp_path)
+    provider.model = SimpleNamespace(generate_content_async=AsyncMock())
+    return provider
+
+
+class TestGeminiTranscriptCache:
+
+    async def test_hit_skips_api_call(self, provider, config):
+        provider.model.generate_content_async.return_value = _fake_response(_SEGMENTS_JSON)
+
+        first = await provider.transcribe(b"audio", config)
+        second = await provider.transcribe(b"audio", config)
+
+        assert provider.model.generate_content_async.await_count == 1
+        assert second.text == first.text == "Barev"
+        assert second.segments == first.segments
+
+    async def test_hit_zeroes_tokens(self, provider, config):
+        provider.model.generate_content_async.return_value = _fake_response(_SEGMENTS_JSON)
+
+        first = await provider.transcribe(b"audio", config)
+        second = await provider.transcribe(b"audio", config)
+
+        assert first.metadata["input_tokens"] == 100
+        assert second.metadata["cache_hit"] is True
+        assert second.metadata["input_tokens"] == 0
+        assert second.metadata["output_tokens"] == 0
+
+    async def test_different_audio_misses(self, provider, config):
+        provider.model.generate_content_async.return_value = _fake_response(_SEGMENTS_JSON)
+
+        await provider.transcribe(b"audio-1", config)
+        await provider.transcribe(b"audio-2", config)
+
+        assert provider.model.generate_content_async.await_count == 2
+
+    async def test_regex_fallback_not_cached(self, provider, config):
+        truncated = '{"segments": [{"speaker": "SPEAKER_00", "start": 0, "end": 1, "text": "Barev"}, {"te'
+        provider.model.generate_content_async.return_value = _fake_response(truncated)
+
+        first = await provider.transcribe(b"audio", config)
+        await provider.transcribe(b"audio", config)
+
+        assert first.metadata["fallback"] == "regex"
+        assert provider.model.generate_content_async.await_count == 2
+
+    async def test_raw_text_fallback_not_cached(self, provider, config):
+        provider.model.generate_content_async.return_value = _fake_response("Just plain text")
+
+        first = await provider.transcribe(b"audio", config)
+        await provider.transcribe(b"audio", config)
+
+        assert "fallback" in first.metadata or "error" in first.metadata
+        assert provider.model.generate_content_async.await_count == 2
+
+    async def test_parse_error_not_cached(self, provider, config):
+        # Valid JSON that fails schema validation ends up in the error path
+        provider.model.generate_content_async.return_value = _fake_response('{"segments": [{"text": "x"}]}')
+
+        first = await provider.transcribe(b"audio", config)
+        await provider.transcribe(b"audio", config)
+
+        assert "error" in first.metadata
+        assert provider.model.generate_content_async.await_count == 2
+
+    async def test_unexpected_finish_reason_not_cached(self, provider, config):
+        provider.model.generate_content_async.return_value = _fake_response(_SEGMENTS_JSON, finish_reason=3)
+
+        await provider.transcribe(b"audio", config)
+        await provider.transcribe(b"audio", config)
+
+        assert provider.model.generate_content_async.await_count == 2
+
+    def test_empty_cache_dir_disables_cache(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "transcript_cache_dir", "")
+
+        assert GeminiProvider(api_key="test-key")._cache is None
+
+    def test_cache_dir_enables_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(get_settings(), "transcript_cache_dir", str(tmp_path))
+
+        assert isinstance(GeminiProvider(api_key="test-key")._cache, TranscriptCache)
@@ -0,0 +1,192 @@
+"""Tests for response helpers in the Gemini provider."""
+
+import json
+
+import pytest
+
+from stt_service.providers.base import TranscriptionConfig, TranscriptionSegment
+from stt_service.providers.gemini import (
+    GeminiProvider,
+    _decode_json_object,
+    _job_prompt_lines,
+    _parse_retry_after,
+    _unescape_json_string,
+)
+from stt_service.utils.exceptions import ProviderError
+
+
+class TestParseRetryAfter:
+
+    def test_retry_info_seconds(self):
+        msg = "429 Quota exceeded. [violations {}, retry_delay { seconds: 13 }]"
+        assert _parse_retry_after(msg) == 13.0
+
+    def test_retry_in_message(self):
+        msg = "429 You exceeded your current quota. Please retry in 7.5s."
+        assert _parse_retry_after(msg) == 7.5
+
+    def test_default_when_missing(self):
+        assert _parse_retry_after("429 Resource has been exhausted") == 60.0
+
+    def test_default_when_delay_has_no_digits(self):
+        assert _parse_retry_after("429 Please retry in .s") == 60.0
+
+
+class TestDecodeJsonObject:
+
+    def test_plain_object(self):
+        assert _decode_json_object('{"segments": []}') == {"segments": []}
+
+    def test_markdown_fenced(self):
+        text = '```json\n{"segments": [{"text": "Barev"}]}\n```'
+        assert _decode_json_object(text) == {"segments": [{"text": "Barev"}]}
+
+    def test_trailing_comma_cleanup(self):
+        text = '{"segments": [{"text": "Barev",},],}'
+        assert _decode_json_object(text) == {"segments": [{"text": "Barev"}]}
+
+    def test_no_object(self):
+        assert _decode_json_object("Just plain text") is None
+
+    def test_truncated_object(self):
+        assert _decode_json_object('{"segments": [{"text": "Bar') is None
+
+
+class TestBuildSegments:
+
+    @pytest.fixture
+    def provider(self):
+        return GeminiProvider(api_key="test-key")
+
+    def test_builds_segments_and_texts(self, provider):
+        data = {"segments": [
+            {"speaker": "SPEAKER_00", "start": 0, "end": "1.5", "text": " Barev "},
+            {"speaker": "SPEAKER_01", "start": 1.5, "end": 3, "text": "Hello", "confidence": 0.9},
+        ]}
+
+        segments, texts = provider._build_segments(data)
+
+        assert texts == ["Barev", "Hello"]
+        assert segments[0].end_time == 1.5
+        assert segments[0].confidence is None
+        assert segments[1].speaker_id == "SPEAKER_01"
+        assert segments[1].confidence == 0.9
+
+    @pytest.mark.parametrize("data, message", [
+        ({}, "missing 'segments'"),
+        ({"segments": {}}, "not a list"),
+        ({"segments": ["x"]}, "not a dict"),
+        ({"segments": [{"speaker": "SPEAKER_00", "start": 0, "text": "x"}]}, "missing required key: end"),
+        ({"segments": [{"speaker": "SPEAKER_00", "start": None, "end": 1, "text": "x"}]}, "timestamps invalid"),
+    ])
+    def test_invalid_structure_raises(self, provider, data, message):
+        with pytest.raises(ProviderError, match=message):
+            provider._build_segments(data)
+
+
+class TestTranscriptionPrompt:
+
+    @pytest.fixture
+    def provider(self):
+        return GeminiProvider(api_key="test-key")
+
+    def test_job_lines_shared_across_chunks(self, provider):
+        _job_prompt_lines.cache_clear()
+        first = TranscriptionConfig(language="hy", audio_duration=300.0, chunk_index=0)
+        second = TranscriptionConfig(language="hy", audio_duration=120.0, chunk_index=1)
+
+        first_prompt = provider._build_transcription_prompt(first)
+        second_prompt = provider._build_transcription_prompt(second)
+
+        assert _job_prompt_lines.cache_info().hits == 1
+        assert "approximately 300.0 seconds" in first_prompt
+        assert "approximately 120.0 seconds" in second_prompt
+        assert "Primary language: Armenian." in second_prompt
+        assert "The audio may also contain: English, Russian." in second_prompt
+
+    def test_job_options_rendered(self, provider):
+        config = TranscriptionConfig(
+            language="auto",
+            additional_languages=[],
+            max_speakers=2,
+            custom_vocabulary=["Yerevan"],
+            prompt="Interview",
+        )
+
+        prompt = provider._build_transcription_prompt(config)
+
+        assert prompt.splitlines() == [
+            "Transcribe the following audio accurately.",
+            "Detect the primary language and transcribe.",
+            "Identify different speakers and label them as SPEAKER_00, SPEAKER_01, etc.",
+            "There are at most 2 speakers.",
+            "Important terms that may appear: Yerevan.",
+            "Context: Interview",
+        ]
+
+
+class TestAlignTimestamps:
+
+    @pytest.fixture
+    def provider(self):
+        return GeminiProvider(api_key="test-key")
+
+    def test_fitting_segments_unchanged(self, provider):
+        segments = [TranscriptionSegment(text="a", start_time=0.0, end_time=5.0)]
+
+        assert provider._align_timestamps(segments, 10.0, 0) is segments
+
+    def test_overflow_is_rescaled(self, provider):
+        segments = [
+            TranscriptionSegment(text="a", start_time=0.0, end_time=10.0, speaker_id="SPEAKER_00"),
+            TranscriptionSegment(text="b", start_time=10.0, end_time=20.0, speaker_id="SPEAKER_01"),
+        ]
+
+        aligned = provider._align_timestamps(segments, 10.0, 0)
+
+        assert [(s.start_time, s.end_time) for s in aligned] == [(0.0, 5.0), (5.0, 10.0)]
+        assert [s.speaker_id for s in aligned] == ["SPEAKER_00", "SPEAKER_01"]
+
+    def test_negative_start_clamped(self, provider):
+        segments = [TranscriptionSegment(text="a", start_time=-1.0, end_time=-0.5)]
+
+        aligned = provider._align_timestamps(segments, 10.0, 0)
+
+        assert (aligned[0].start_time, aligned[0].end_time) == (0.0, 0.1)
+
+
+class TestRegexFallback:
+
+    @pytest.fixture
+    def provider(self):
+        return GeminiProvider(api_key="test-key")
+
+    def test_extracts_complete_text_fields(self, provider):
+        text = '{"segments": [{"text": "Say \\"barev\\"\\nnow", "start": 0}, {"text": "Hello"}, {"text": "trunc'
+
+        result = provider._parse_response_regex_fallback(text, TranscriptionConfig(), 10.0, None)
+
+        assert result.text == 'Say "barev"\nnow Hello'
+        assert result.metadata["fallback"] == "regex"
+        assert result.segments[0].end_time == 10.0
+
+    def test_no_text_fields_raises(self, provider):
+        with pytest.raises(ProviderError, match="regex extraction failed"):
+            provider._parse_response_regex_fallback('{"segments": [{"te', TranscriptionConfig(), 10.0, None)
+
+
+class TestUnescapeJsonString:
+
+    @pytest.mark.parametrize("body", [
+        "plain Բարև",
+        'quote \\" and backslash \\\\',
+        "controls \\n\\t\\r\\b\\f and slash \\/",
+        "bmp \\u0532\\u0561\\u0580\\u0587",
+        "emoji \\ud83d\\ude00 pair",
+    ])
+    def test_matches_json_decoding(self, body):
+        assert _unescape_json_string(body) == json.loads(f'"{body}"')
+
+    def test_unknown_escape_left_as_is(self):
+        assert _unescape_json_string("a\\xb") == "a\\xb"
+
@@ -0,0 +1,183 @@
+"""Tests for GeminiProvider.transcribe request handling."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import google.generativeai as genai
+import pytest
+
+from stt_service.config import get_settings
+from stt_service.providers.base import TranscriptionConfig
+from stt_service.providers import gemini as gemini_module
+from stt_service.providers.gemini import GeminiProvider
+from stt_service.utils.exceptions import ProviderError
+
+_SEGMENTS_JSON = json.dumps(
+    {"segments": [{"speaker": "SPEAKER_00", "start": 0.0, "end": 2.0, "text": "Barev"}]}
+)
+
+
+def _fake_response(text: str, finish_reason: int = 1) -> SimpleNamespace:
+    """Minimal stand-in for a google-generativeai response object."""
+    return SimpleNamespace(
+        text=text,
+        candidates=[SimpleNamespace(finish_reason=finish_reason)],
+        usage_metadata=SimpleNamespace(prompt_token_count=100, candidates_token_count=20),
+    )
+
+
+@pytest.fixture
+def config():
+    return TranscriptionConfig(language="hy", audio_duration=10.0)
+
+
+@pytest.fixture
+def provider():
+    """GeminiProvider with a mocked model and no transcript cache."""
+    provider = GeminiProvider(api_key="test-key")
+    provider._cache = None
+    provider.model = SimpleNamespace(generate_content_async=AsyncMock())
+    return provider
+
+
+class TestGeminiGenerationConfig:
+
+    async def test_config_reused_across_requests(self, provider, config):
+        provider.model.generate_content_async.return_value = _fake_response(_SEGMENTS_JSON)
+
+        await provider.transcribe(b"audio-1", config)
+        await provider.transcribe(b"audio-2", config)
+
+        first, second = provider.model.generate_content_async.await_args_list
+        assert first.kwargs["generation_config"] is second.kwargs["generation_config"]
+
+    def test_schema_is_prebuilt_proto(self, provider):
+        schema = provider._generation_config["response_schema"]
+
+        assert isinstance(schema, genai.protos.Schema)
+        assert list(schema.required) == ["segments"]
+        assert list(schema.properties["segments"].items.required) == ["speaker", "start", "end", "text"]
+
+
+class TestGeminiTruncation:
+
+    async def test_max_tokens_fails_before_parsing(self, provider, config, monkeypatch):
+        provider.model.generate_content_async.return_value = _fake_response('{"segments": [{"te', finish_reason=2)
+        parse = MagicMock()
+        monkeypatch.setattr(provider, "_parse_response", parse)
+
+        with pytest.raises(ProviderError) as exc_info:
+            await provider.transcribe(b"audio", config)
+
+        assert "truncated" in exc_info.value.message
+        parse.assert_not_called()
+
+
+class TestGeminiAudioPart:
+
+    async def test_audio_sent_as_raw_bytes(self, provider, config):
+        provider.model.generate_content_async.return_value = _fake_response(_SEGMENTS_JSON)
+
+        await provider.transcribe(b"audio", config, audio_format="mp3")
+
+        _, audio_part = provider.model.generate_content_async.await_args.args[0]
+        assert audio_part == {"mime_type": "audio/mp3", "data": b"audio"}
+
+
+class TestGeminiFileUpload:
+
+    @pytest.fixture
+    def files_api(self, monkeypatch):
+        """Mocked File API functions on the genai module used by the provider."""
+        uploaded = SimpleNamespace(name="files/abc", state=SimpleNamespace(name="ACTIVE"))
+        api = SimpleNamespace(
+            upload_file=MagicMock(return_value=uploaded),
+            get_file=MagicMock(return_value=uploaded),
+            delete_file=MagicMock(),
+            uploaded=uploaded,
+        )
+        monkeypatch.setattr(gemini_module.genai, "upload_file", api.upload_file)
+        monkeypatch.setattr(gemini_module.genai, "get_file", api.get_file)
+        monkeypatch.setattr(gemini_module.genai, "delete_file", api.delete_file)
+        monkeypatch.setattr(get_settings().providers, "gemini_inline_max_bytes", 4)
+        return api
+
+    async def test_small_audio_is_inlined(self, provider, config, files_api):
+        provider.model.generate_content_async.return_value = _fake_response(_SEGMENTS_JSON)
+
+        await provider.transcribe(b"tiny", config)
+
+        files_api.upload_file.assert_not_called()
+
+    async def test_large_audio_is_uploaded_and_deleted(self, provider, config, files_api):
+        provider.model.generate_content_async.return_value = _fake_response(_SEGMENTS_JSON)
+
+        result = await provider.transcribe(b"larger audio", config, audio_format="mp3")
+
+        assert files_api.upload_file.call_args.kwargs["mime_type"] == "audio/mp3"
+        _, audio_part = provider.model.generate_content_async.await_args.args[0]
+        assert audio_part is files_api.uploaded
+        files_api.delete_file.assert_called_once_with("files/abc")
+        assert result.text == "Barev"
+
+    async def test_uploaded_file_deleted_on_api_error(self, provider, config, files_api):
+        provider.model.generate_content_async.side_effect = RuntimeError("boom")
+
+        with pytest.raises(ProviderError):
+            await provider.transcribe(b"larger audio", config)
+
+        files_api.delete_file.assert_called_once_with("files/abc")
+
+    async def test_failed_processing_raises(self, provider, config, files_api):
+        files_api.uploaded.state.name = "FAILED"
+
+        with pytest.raises(ProviderError) as exc_info:
+            await provider.transcribe(b"larger audio", config)
+
+        assert "processing failed" in exc_info.value.message
+        provider.model.generate_content_async.assert_not_awaited()
+        files_api.delete_file.assert_called_once_with("files/abc")
+
+
+class TestGeminiTranscribeBatch:
+
+    async def test_returns_results_in_chunk_order(self, provider):
+        async def generate(contents, **kwargs):
+            text = contents[1]["data"].decode()
+            return _fake_response(json.dumps(
+                {"segments": [{"speaker": "SPEAKER_00", "start": 0, "end": 1, "text": text}]}
+            ))
+
+        provider.model.generate_content_async.side_effect = generate
+        configs = [TranscriptionConfig(language="hy", chunk_index=i) for i in range(3)]
+
+        results = await provider.transcribe_batch([b"one", b"two", b"three"], configs)
+
+        assert [r.text for r in results] == ["one", "two", "three"]
+
+    async def test_concurrency_is_bounded(self, provider, monkeypatch):
+        monkeypatch.setattr(get_settings().providers, "gemini_max_concurrency", 2)
+        in_flight = 0
+        peak = 0
+
+        async def generate(contents, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _fake_response(_SEGMENTS_JSON)
+
+        provider.model.generate_content_async.side_effect = generate
+        configs = [TranscriptionConfig(language="hy", chunk_index=i) for i in range(5)]
+
+        results = await provider.transcribe_batch([b"audio"] * 5, configs)
+
+        assert len(results) == 5
+        assert peak == 2
+
+    async def test_mismatched_lengths_rejected(self, provider, config):
+        with pytest.raises(ValueError):
+            await provider.transcribe_batch([b"a", b"b"], [config])
@@ -0,0 +1,121 @@
+"""Tests for HiSpeechProvider request handling and response parsing."""
+
+import httpx
+import pytest
+
+from stt_service.providers.base import TranscriptionConfig
+from stt_service.providers.hispeech import HiSpeechProvider
+from stt_service.utils.exceptions import ProviderError, RateLimitError
+
+
+@pytest.fixture
+def config():
+    return TranscriptionConfig(language="hy")
+
+
+def _provider(handler) -> HiSpeechProvider:
+    """HiSpeechProvider whose HTTP client is served by a mock transport."""
+    provider = HiSpeechProvider(api_key="test-key")
+    provider.client = httpx.AsyncClient(
+        base_url="https://hispeech.test",
+        transport=httpx.MockTransport(handler),
+    )
+    return provider
+
+
+class TestHiSpeechTranscribe:
+
+    async def test_parses_segments(self, config):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={
+                "segments": [
+                    {"text": "Բարև", "start": 0, "end": 1.5, "speaker": "SPEAKER_00"},
+                    {"text": "ձեզ", "start": 1.5, "end": 3, "speaker": "SPEAKER_01"},
+                ],
+                "language": "hy",
+            })
+
+        result = await _provider(handler).transcribe(b"audio", config)
+
+        assert result.text == "Բարև ձեզ"
+        assert [s.speaker_id for s in result.segments] == ["SPEAKER_00", "SPEAKER_01"]
+        assert result.segments[1].end_time == 3.0
+
+    async def test_rate_limit(self, config):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(429, headers={"Retry-After": "12"})
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await _provider(handler).transcribe(b"audio", config)
+
+        assert exc_info.value.retry_after == 12.0
+
+    async def test_server_error_is_retryable(self, config):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(503, text="unavailable")
+
+        with pytest.raises(ProviderError) as exc_info:
+            await _provider(handler).transcribe(b"audio", config)
+
+        assert exc_info.value.retryable is True
+
+    async def test_transcribe_file_streams_file(self, config, tmp_path):
+        audio_path = tmp_path / "clip.mp3"
+        audio_path.write_bytes(b"mp3-bytes")
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            return httpx.Response(200, json={"text": "Բարև"})
+
+        result = await _provider(handler).transcribe_file(str(audio_path), config)
+
+        assert result.text == "Բարև"
+        assert b"mp3-bytes" in bodies[0]
+        assert b'filename="audio.mp3"' in bodies[0]
+
+
+class TestHiSpeechParseResponse:
+
+    @pytest.fixture
+    def provider(self):
+        return HiSpeechProvider(api_key="test-key")
+
+    def test_alternate_field_names(self, provider, config):
+        result = {"utterances": [
+            {"transcript": "Բարև", "start_time": 0.5, "end_time": 1.0, "speaker_id": "A"},
+            {"transcript": "ձեզ", "start_time": 1.0, "end_time": 2.0, "speaker_id": "B"},
+        ]}
+
+        response = provider._parse_response(result, config)
+
+        assert response.text == "Բարև ձեզ"
+        assert [(s.start_time, s.end_time, s.speaker_id) for s in response.segments] == [
+            (0.5, 1.0, "A"),
+            (1.0, 2.0, "B"),
+        ]
+
+    def test_missing_fields_default(self, provider, config):
+        result = {"segments": [{"text": "Բարև", "start": 0, "end": 1}, {"start": 1}]}
+
+        response = provider._parse_response(result, config)
+
+        assert response.segments[1].text == ""
+        assert response.segments[1].end_time == 0.0
+        assert response.segments[1].speaker_id is None
+
+    def test_text_only_response(self, provider, config):
+        response = provider._parse_response({"text": "Բարև", "duration": 2.5}, config)
+
+        assert len(response.segments) == 1
+        assert response.segments[0].end_time == 2.5
+
+
+class TestHiSpeechSupportsLanguage:
+
+    @pytest.mark.parametrize("language", ["hy", "en", "ru"])
+    def test_supported(self, language):
+        assert HiSpeechProvider(api_key="k").supports_language(language) is True
+
+    def test_unsupported(self):
+        assert HiSpeechProvider(api_key="k").supports_language("de") is False
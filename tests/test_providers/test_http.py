@@ -0,0 +1,176 @@
+"""Tests for the shared provider HTTP clients."""
+
+import asyncio
+import socket
+
+import httpx
+
+from stt_service.providers import http
+from stt_service.providers.http import (
+    ERROR_SNIPPET_BYTES,
+    close_shared_clients,
+    error_snippet,
+    get_shared_client,
+)
+from stt_service.providers.wav import WavProvider
+from stt_service.providers.whisper import WhisperProvider
+
+_TIMEOUT = httpx.Timeout(10.0)
+
+
+class TestSharedClient:
+
+    async def test_same_loop_shares_client(self):
+        first = get_shared_client("https://api.test", {"x-auth-token": "k"}, _TIMEOUT)
+        second = get_shared_client("https://api.test", {"x-auth-token": "k"}, _TIMEOUT)
+
+        assert first is second
+        await close_shared_clients()
+
+    async def test_different_credentials_get_own_client(self):
+        first = get_shared_client("https://api.test", {"x-auth-token": "a"}, _TIMEOUT)
+        second = get_shared_client("https://api.test", {"x-auth-token": "b"}, _TIMEOUT)
+
+        assert first is not second
+        await close_shared_clients()
+
+    async def test_closed_client_replaced(self):
+        first = get_shared_client("https://api.test", {}, _TIMEOUT)
+        await first.aclose()
+
+        second = get_shared_client("https://api.test", {}, _TIMEOUT)
+
+        assert second is not first
+        assert not second.is_closed
+        await close_shared_clients()
+
+    async def test_closing_one_client_keeps_shared_transport_open(self, monkeypatch):
+        class ClosableMockTransport(httpx.MockTransport):
+            closed = False
+
+            async def handle_async_request(self, request):
+                assert not self.closed, "request sent on a closed transport"
+                return await super().handle_async_request(request)
+
+            async def aclose(self):
+                self.closed = True
+
+        def handler(request):
+            return httpx.Response(200, text="ok")
+
+        monkeypatch.setattr(http, "_make_transport", lambda http2, limits: ClosableMockTransport(handler))
+        first = get_shared_client("https://api.test", {"x-auth-token": "a"}, _TIMEOUT)
+        second = get_shared_client("https://api.test", {"x-auth-token": "b"}, _TIMEOUT)
+
+        await first.aclose()
+        third = get_shared_client("https://api.test", {"x-auth-token": "a"}, _TIMEOUT)
+
+        assert (await second.get("/")).text == "ok"
+        assert (await third.get("/")).text == "ok"
+        await close_shared_clients()
+
+    async def test_close_shared_clients(self):
+        client = get_shared_client("https://api.test", {}, _TIMEOUT)
+
+        await close_shared_clients()
+
+        assert client.is_closed
+        assert get_shared_client("https://api.test", {}, _TIMEOUT) is not client
+        await close_shared_clients()
+
+    def test_separate_loops_get_separate_clients(self):
+        async def get_client():
+            client = get_shared_client("https://api.test", {}, _TIMEOUT)
+            await close_shared_clients()
+            return client
+
+        assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
+    def test_outside_loop_returns_unshared_client(self):
+        first = get_shared_client("https://api.test", {}, _TIMEOUT)
+        second = get_shared_client("https://api.test", {}, _TIMEOUT)
+
+        assert first is not second
+
+    async def test_pool_limits_applied(self):
+        limits = httpx.Limits(max_connections=7, max_keepalive_connections=3)
+        client = get_shared_client("https://api.test", {}, _TIMEOUT, limits=limits)
+
+        pool = client._transport._transport._pool
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        await close_shared_clients()
+
+    async def test_http2_enabled_by_default(self):
+        client = get_shared_client("https://api.test", {}, _TIMEOUT)
+
+        assert client._transport._transport._pool._http2 is True
+        await close_shared_clients()
+
+    async def test_keepalive_socket_options(self):
+        client = get_shared_client("https://api.test", {}, _TIMEOUT)
+
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in client._transport._transport._pool._socket_options
+        await close_shared_clients()
+
+    async def test_clients_share_transport(self):
+        first = get_shared_client("https://api.one.test", {"x-auth-token": "a"}, _TIMEOUT)
+        second = get_shared_client("https://api.two.test", {"Authorization": "b"}, _TIMEOUT)
+
+        assert first is not second
+        assert first._transport._transport is second._transport._transport
+        await close_shared_clients()
+
+    async def test_different_limits_get_own_transport(self):
+        first = get_shared_client("https://api.one.test", {}, _TIMEOUT)
+        second = get_shared_client(
+            "https://api.two.test", {}, _TIMEOUT, limits=httpx.Limits(max_connections=1)
+        )
+
+        assert first._transport._transport is not second._transport._transport
+        await close_shared_clients()
+
+    def test_ssl_context_reused_across_loops(self):
+        async def get_ssl_context():
+            client = get_shared_client("https://api.test", {}, _TIMEOUT)
+            ssl_context = client._transport._transport._pool._ssl_context
+            await close_shared_clients()
+            return ssl_context
+
+        assert asyncio.run(get_ssl_context()) is asyncio.run(get_ssl_context())
+
+
+class TestProviderClients:
+
+    async def test_wav_instances_share_client(self):
+        assert WavProvider(api_key="k").client is WavProvider(api_key="k").client
+        await close_shared_clients()
+
+    async def test_whisper_instances_share_client(self):
+        assert WhisperProvider(api_key="k").client is WhisperProvider(api_key="k").client
+        await close_shared_clients()
+
+    async def test_provider_close_leaves_shared_client_open(self):
+        provider = WhisperProvider(api_key="k")
+
+        await provider.close()
+
+        assert not provider.client.is_closed
+        await close_shared_clients()
+
+
+class TestErrorSnippet:
+
+    def test_short_body_returned_whole(self):
+        assert error_snippet(httpx.Response(500, text="Server error")) == "Server error"
+
+    def test_long_body_truncated(self):
+        response = httpx.Response(500, content=b"x" * (ERROR_SNIPPET_BYTES * 10))
+
+        assert error_snippet(response) == "x" * ERROR_SNIPPET_BYTES
+
+    def test_split_multibyte_character_replaced(self):
+        # "Բ" is two bytes in UTF-8; cut it in half at the limit
+        response = httpx.Response(500, content=b"x" * (ERROR_SNIPPET_BYTES - 1) + "Բ".encode())
+
+        assert error_snippet(response).endswith("�")
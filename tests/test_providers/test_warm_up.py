@@ -0,0 +1,72 @@
+"""Tests for provider warm-up before the first transcription."""
+
+import httpx
+
+from stt_service.providers.wav import WavProvider
+from stt_service.providers.whisper import WhisperProvider
+
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(base_url="https://api.test", transport=httpx.MockTransport(handler))
+
+
+class TestWhisperWarmUp:
+
+    async def test_requests_models(self):
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(200, json={"data": []})
+
+        provider = WhisperProvider(api_key="test-key")
+        provider.client = _mock_client(handler)
+
+        await provider.warm_up()
+
+        assert paths == ["/models"]
+
+    async def test_connection_error_swallowed(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("unreachable")
+
+        provider = WhisperProvider(api_key="test-key")
+        provider.client = _mock_client(handler)
+
+        await provider.warm_up()
+
+    async def test_skipped_without_api_key(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("no request expected")
+
+        provider = WhisperProvider(api_key="test-key")
+        provider.api_key = ""
+        provider.client = _mock_client(handler)
+
+        await provider.warm_up()
+
+
+class TestWavWarmUp:
+
+    async def test_resolves_project_id(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[{"name": "STT-Tool", "id": 42}])
+
+        provider = WavProvider(api_key="test-key")
+        provider.project_name = "STT-Tool"
+        provider.client = _mock_client(handler)
+
+        await provider.warm_up()
+
+        assert provider._project_id == "42"
+
+    async def test_api_error_swallowed(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500, text="down")
+
+        provider = WavProvider(api_key="test-key")
+        provider.client = _mock_client(handler)
+
+        await provider.warm_up()
+
+        assert provider._project_id is None
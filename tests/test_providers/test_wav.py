@@ -0,0 +1,148 @@
+"""Tests for WavProvider project resolution and uploads."""
+
+import json
+
+import httpx
+import pytest
+
+from stt_service.config import get_settings
+from stt_service.providers import wav
+from stt_service.providers.base import TranscriptionConfig
+from stt_service.providers.wav import WavProvider
+from stt_service.utils.exceptions import ProviderError
+
+
+def _provider(handler) -> WavProvider:
+    """WavProvider whose HTTP client is served by a mock transport."""
+    provider = WavProvider(api_key="test-key")
+    provider.project_name = "STT-Tool"
+    provider.client = httpx.AsyncClient(
+        base_url="https://wav.test",
+        transport=httpx.MockTransport(handler),
+    )
+    return provider
+
+
+def _projects_handler(paths: list[str]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json=[{"name": "STT-Tool", "id": 42}])
+
+    return handler
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "wav_projects.json"
+    monkeypatch.setattr(get_settings().providers, "wav_project_cache_file", str(path))
+    return path
+
+
+class TestWavProjectCache:
+
+    async def test_resolved_once_per_process(self):
+        paths = []
+
+        assert await _provider(_projects_handler(paths))._ensure_project() == "42"
+        assert await _provider(_projects_handler(paths))._ensure_project() == "42"
+
+        assert paths == ["/get_projects/"]
+
+    async def test_persisted_to_cache_file(self, cache_file):
+        await _provider(_projects_handler([]))._ensure_project()
+
+        assert list(json.loads(cache_file.read_text()).values()) == ["42"]
+
+    async def test_loaded_from_cache_file(self, cache_file):
+        await _provider(_projects_handler([]))._ensure_project()
+        # Simulate a restart: nothing resolved in this process yet
+        wav._project_ids.clear()
+        paths = []
+
+        assert await _provider(_projects_handler(paths))._ensure_project() == "42"
+        assert paths == []
+
+    async def test_cache_key_does_not_contain_api_key(self, cache_file):
+        await _provider(_projects_handler([]))._ensure_project()
+
+        assert "test-key" not in cache_file.read_text()
+
+    async def test_stale_cached_project_dropped(self, cache_file):
+        await _provider(_projects_handler([]))._ensure_project()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, text="Project not found")
+
+        provider = _provider(handler)
+        with pytest.raises(ProviderError) as exc_info:
+            await provider.transcribe(b"audio", TranscriptionConfig(language="hy"))
+
+        assert exc_info.value.retryable is True
+        assert provider._project_id is None
+        assert json.loads(cache_file.read_text()) == {}
+
+    async def test_bad_request_with_fresh_project_not_retryable(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/transcribe_audio/":
+                return httpx.Response(400, text="Bad audio")
+            return httpx.Response(200, json=[{"name": "STT-Tool", "id": 42}])
+
+        with pytest.raises(ProviderError) as exc_info:
+            await _provider(handler).transcribe(b"audio", TranscriptionConfig(language="hy"))
+
+        assert exc_info.value.retryable is False
+
+
+class TestWavProjectLookup:
+
+    async def test_dict_response_supported(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"projects": [{"name": "Other", "id": 1}, {"name": "STT-Tool", "id": 7}]})
+
+        assert await _provider(handler)._ensure_project() == "7"
+
+    async def test_missing_project_created(self):
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path == "/add_project/":
+                return httpx.Response(200, json=99)
+            return httpx.Response(200, json=[{"name": "Other", "id": 1}])
+
+        assert await _provider(handler)._ensure_project() == "99"
+        assert paths == ["/get_projects/", "/add_project/"]
+
+
+class TestWavTranscribeFile:
+
+    async def test_streams_file(self, tmp_path):
+        audio_path = tmp_path / "clip.mp3"
+        audio_path.write_bytes(b"mp3-bytes")
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/transcribe_audio/":
+                bodies.append(request.content)
+                return httpx.Response(200, json=[{"speaker": "speaker_0", "text": "Barev"}])
+            return httpx.Response(200, json=[{"name": "STT-Tool", "id": 42}])
+
+        result = await _provider(handler).transcribe_file(str(audio_path), TranscriptionConfig(language="hy"))
+
+        assert result.text == "Barev"
+        assert b"mp3-bytes" in bodies[0]
+        assert b'filename="audio.mp3"' in bodies[0]
+
+    async def test_transcribe_resolves_project_once(self):
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path == "/transcribe_audio/":
+                return httpx.Response(200, json=[{"speaker": "speaker_0", "text": "Barev"}])
+            return httpx.Response(200, json=[{"name": "STT-Tool", "id": 42}])
+
+        result = await _provider(handler).transcribe(b"audio", TranscriptionConfig(language="hy"))
+
+        assert result.text == "Barev"
+        assert paths == ["/get_projects/", "/transcribe_audio/"]
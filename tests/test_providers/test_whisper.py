@@ -0,0 +1,112 @@
+"""Tests for WhisperProvider response parsing and uploads."""
+
+import httpx
+import pytest
+
+from stt_service.providers.base import TranscriptionConfig
+from stt_service.providers.whisper import WhisperProvider
+
+
+@pytest.fixture
+def provider():
+    """Create WhisperProvider with a dummy key (no API calls made)."""
+    return WhisperProvider(api_key="test-key")
+
+
+def _reference_words(result: dict, seg: dict) -> list[dict] | None:
+    """Word matching as done by the original nested scan."""
+    seg_words = [
+        w for w in result["words"]
+        if w.get("start", 0) >= seg.get("start", 0) and w.get("end", 0) <= seg.get("end", 0)
+    ]
+    if not seg_words:
+        return None
+    return [
+        {"text": w.get("word", ""), "start_time": w.get("start", 0), "end_time": w.get("end", 0)}
+        for w in seg_words
+    ]
+
+
+_RESULT = {
+    "text": " Barev dzez. Inchpes eq?",
+    "language": "armenian",
+    "duration": 4.0,
+    "segments": [
+        {"text": " Barev dzez.", "start": 0.0, "end": 1.5, "avg_logprob": -0.2},
+        {"text": " Inchpes eq?", "start": 1.5, "end": 3.0, "avg_logprob": -0.3},
+        {"text": " ", "start": 3.0, "end": 4.0, "avg_logprob": -1.0},
+    ],
+    "words": [
+        {"word": "Barev", "start": 0.0, "end": 0.6},
+        {"word": "dzez", "start": 0.7, "end": 1.5},
+        {"word": "Inchpes", "start": 1.5, "end": 2.2},
+        # Straddles the segment boundary: matches neither segment
+        {"word": "eq", "start": 2.4, "end": 3.2},
+    ],
+}
+
+
+class TestWhisperParseResponse:
+
+    def test_segments(self, provider):
+        response = provider._parse_response(_RESULT, TranscriptionConfig(language="hy"))
+
+        assert response.text == "Barev dzez. Inchpes eq?"
+        assert [s.text for s in response.segments] == ["Barev dzez.", "Inchpes eq?", ""]
+        assert response.segments[1].start_time == 1.5
+        assert response.segments[1].confidence == -0.3
+        assert all(s.words is None for s in response.segments)
+
+    def test_words_matched_like_nested_scan(self, provider):
+        config = TranscriptionConfig(language="hy", timestamp_granularity="word")
+
+        response = provider._parse_response(_RESULT, config)
+
+        assert [s.words for s in response.segments] == [
+            _reference_words(_RESULT, seg) for seg in _RESULT["segments"]
+        ]
+        assert [w["text"] for w in response.segments[0].words] == ["Barev", "dzez"]
+
+    def test_overlapping_segments_share_words(self, provider):
+        result = {
+            "text": "a b",
+            "segments": [
+                {"text": "a b", "start": 0.0, "end": 2.0},
+                {"text": "b", "start": 1.0, "end": 2.0},
+            ],
+            "words": [
+                {"word": "a", "start": 0.0, "end": 0.9},
+                {"word": "b", "start": 1.0, "end": 2.0},
+            ],
+        }
+        config = TranscriptionConfig(language="hy", timestamp_granularity="word")
+
+        response = provider._parse_response(result, config)
+
+        assert [s.words for s in response.segments] == [
+            _reference_words(result, seg) for seg in result["segments"]
+        ]
+
+
+class TestWhisperTranscribeFile:
+
+    async def test_streams_file(self, tmp_path):
+        audio_path = tmp_path / "clip.mp3"
+        audio_path.write_bytes(b"mp3-bytes")
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            return httpx.Response(200, json={"text": "Barev", "segments": []})
+
+        provider = WhisperProvider(api_key="test-key")
+        provider.client = httpx.AsyncClient(
+            base_url="https://openai.test",
+            transport=httpx.MockTransport(handler),
+        )
+
+        result = await provider.transcribe_file(str(audio_path), TranscriptionConfig(language="hy"))
+
+        assert result.text == "Barev"
+        assert b"mp3-bytes" in bodies[0]
+        assert b'filename="audio.mp3"' in bodies[0]
@@ -0,0 +1,159 @@
+"""Tests for the token bucket rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from stt_service.services.rate_limiter import RateLimiter, RateLimitState
+
+
+@pytest.fixture
+def limiter():
+    limiter = RateLimiter()
+    # 60 RPM with a burst of 2: one token per second
+    limiter.configure_provider("test", requests_per_minute=60, burst_size=2)
+    return limiter
+
+
+class TestRateLimiter:
+
+    async def test_unconfigured_provider_not_limited(self, limiter):
+        assert await limiter.acquire("other") == 0.0
+        assert await limiter.try_acquire("other") is True
+        await limiter.report_rate_limit("other", retry_after=5)
+        await limiter.report_success("other")
+
+    async def test_burst_then_exhausted(self, limiter):
+        assert await limiter.try_acquire("test") is True
+        assert await limiter.try_acquire("test") is True
+        assert await limiter.try_acquire("test") is False
+
+    async def test_acquire_waits_when_exhausted(self):
+        limiter = RateLimiter()
+        # 100 tokens per second, so the wait is ~10ms
+        limiter.configure_provider("fast", requests_per_minute=6000, burst_size=1)
+
+        assert await limiter.acquire("fast") == 0.0
+        waited = await limiter.acquire("fast")
+
+        assert 0 < waited < 0.1
+        assert await limiter.try_acquire("fast") is False
+
+    async def test_concurrent_waiters_all_admitted(self):
+        limiter = RateLimiter()
+        limiter.configure_provider("fast", requests_per_minute=6000, burst_size=1)
+
+        waits = await asyncio.gather(*(limiter.acquire("fast") for _ in range(4)))
+
+        assert waits[0] == 0.0
+        assert all(w > 0 for w in waits[1:])
+        # Each token was handed out once: the bucket is empty again
+        assert limiter.get_status("fast")["available_tokens"] < 1
+
+    async def test_report_rate_limit_halves_rate(self, limiter):
+        await limiter.report_rate_limit("test")
+
+        assert limiter.get_status("test")["adaptive_factor"] == 0.5
+
+    async def test_report_success_restores_rate(self, limiter):
+        await limiter.report_rate_limit("test")
+        await limiter.report_success("test")
+
+        assert limiter.get_status("test")["adaptive_factor"] == pytest.approx(0.55)
+
+    def test_usable_from_successive_event_loops(self):
+        # Celery runs every task in a new loop; contended waits in one loop
+        # must not leave the limiter bound to it
+        limiter = RateLimiter()
+        limiter.configure_provider("fast", requests_per_minute=6000, burst_size=1)
+
+        async def contend():
+            await asyncio.gather(*(limiter.acquire("fast") for _ in range(3)))
+
+        asyncio.run(contend())
+        asyncio.run(contend())
+
+
+class TestRateLimitState:
+
+    def test_effective_rate_follows_adaptive_factor(self):
+        state = RateLimitState(tokens=0.0, last_update=0.0, max_tokens=10.0, refill_rate=2.0)
+
+        state.set_adaptive_factor(0.5)
+
+        assert state.effective_rate == 1.0
+        assert state.inv_effective_rate == 1.0
+        assert state.get_available_tokens(3.0) == 3.0
+
+    def test_no_instance_dict(self):
+        state = RateLimitState(tokens=0.0, last_update=0.0, max_tokens=10.0, refill_rate=2.0)
+
+        assert not hasattr(state, "__dict__")
+
+
+class TestRateLimiterWaiters:
+
+    async def test_report_success_wakes_waiters(self):
+        limiter = RateLimiter()
+        limiter.configure_provider("slow", requests_per_minute=6, burst_size=1)
+        await limiter.acquire("slow")
+        # Throttled to 0.01 tokens/s: the next token is ~100s away
+        bucket = limiter._buckets["slow"]
+        bucket.set_adaptive_factor(0.1)
+
+        waiter = asyncio.create_task(limiter.acquire("slow"))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        # Restore the rate and refill the bucket, as if time had passed
+        bucket.tokens = 1.0
+        await limiter.report_success("slow")
+
+        assert await asyncio.wait_for(waiter, timeout=1) < 1
+
+    async def test_later_caller_does_not_overtake_waiter(self):
+        limiter = RateLimiter()
+        # 10 tokens per second, so a waiter sleeps ~100ms
+        limiter.configure_provider("fast", requests_per_minute=600, burst_size=1)
+        await limiter.acquire("fast")
+        order = []
+
+        async def acquire(name):
+            await limiter.acquire("fast")
+            order.append(name)
+
+        first = asyncio.create_task(acquire("first"))
+        await asyncio.sleep(0)
+        # Refill the bucket while the first caller is still asleep
+        bucket = limiter._buckets["fast"]
+        bucket.tokens = 1.0
+        bucket.last_update = time.monotonic()
+
+        assert await limiter.try_acquire("fast") is False
+        await asyncio.wait_for(asyncio.gather(first, acquire("late")), timeout=1)
+
+        assert order == ["first", "late"]
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = RateLimiter()
+        limiter.configure_provider("fast", requests_per_minute=600, burst_size=1)
+        await limiter.acquire("fast")
+
+        first = asyncio.create_task(limiter.acquire("fast"))
+        second = asyncio.create_task(limiter.acquire("fast"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await asyncio.wait_for(second, timeout=1) > 0
+        assert not limiter._waiters["fast"]
+
+    async def test_retry_after_does_not_block_other_calls(self, limiter):
+        reporter = asyncio.create_task(limiter.report_rate_limit("test", retry_after=5))
+        await asyncio.sleep(0)
+
+        # Both take the provider's condition; neither may wait for the reporter
+        await asyncio.wait_for(limiter.report_success("test"), timeout=1)
+
+        assert not reporter.done()
+        reporter.cancel()
@@ -0,0 +1,82 @@
+"""Tests for StorageService server-side copies."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from stt_service.services import storage
+from stt_service.services.storage import StorageService
+
+
+@pytest.fixture
+def client():
+    """S3 client double; every operation is an AsyncMock."""
+    client = AsyncMock()
+    client.head_object.return_value = {
+        "ContentLength": 100,
+        "ContentType": "audio/wav",
+        "Metadata": {"job": "1"},
+    }
+    client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    client.upload_part_copy.side_effect = lambda **kwargs: {
+        "CopyPartResult": {"ETag": f"etag-{kwargs['PartNumber']}"}
+    }
+    return client
+
+
+@pytest.fixture
+def service(client, monkeypatch):
+    service = StorageService()
+    monkeypatch.setattr(service, "_get_client", AsyncMock(return_value=client))
+    return service
+
+
+def _assert_no_data_transfer(client):
+    client.get_object.assert_not_called()
+    client.upload_fileobj.assert_not_called()
+    client.download_fileobj.assert_not_called()
+    client.copy.assert_not_called()
+
+
+class TestCopyFile:
+
+    async def test_small_object_uses_copy_object(self, service, client):
+        assert await service.copy_file("src.wav", "dst.wav") == "dst.wav"
+
+        client.copy_object.assert_awaited_once()
+        kwargs = client.copy_object.await_args.kwargs
+        assert kwargs["Key"] == "dst.wav"
+        assert kwargs["CopySource"]["Key"] == "src.wav"
+        client.create_multipart_upload.assert_not_called()
+        _assert_no_data_transfer(client)
+
+    async def test_large_object_copied_in_parts(self, service, client, monkeypatch):
+        monkeypatch.setattr(storage, "COPY_OBJECT_MAX_SIZE", 50)
+        monkeypatch.setattr(storage, "MULTIPART_CHUNKSIZE", 40)
+
+        await service.copy_file("src.wav", "dst.wav")
+
+        client.copy_object.assert_not_called()
+        ranges = [call.kwargs["CopySourceRange"] for call in client.upload_part_copy.await_args_list]
+        assert ranges == ["bytes=0-39", "bytes=40-79", "bytes=80-99"]
+        create_kwargs = client.create_multipart_upload.await_args.kwargs
+        assert create_kwargs["ContentType"] == "audio/wav"
+        assert create_kwargs["Metadata"] == {"job": "1"}
+        parts = client.complete_multipart_upload.await_args.kwargs["MultipartUpload"]["Parts"]
+        assert parts == [
+            {"PartNumber": 1, "ETag": "etag-1"},
+            {"PartNumber": 2, "ETag": "etag-2"},
+            {"PartNumber": 3, "ETag": "etag-3"},
+        ]
+        _assert_no_data_transfer(client)
+
+    async def test_failed_part_aborts_upload(self, service, client, monkeypatch):
+        monkeypatch.setattr(storage, "COPY_OBJECT_MAX_SIZE", 50)
+        monkeypatch.setattr(storage, "MULTIPART_CHUNKSIZE", 40)
+        client.upload_part_copy.side_effect = RuntimeError("part failed")
+
+        with pytest.raises(RuntimeError):
+            await service.copy_file("src.wav", "dst.wav")
+
+        client.abort_multipart_upload.assert_awaited_once()
+        client.complete_multipart_upload.assert_not_called()
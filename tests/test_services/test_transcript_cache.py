@@ -0,0 +1,63 @@
+"""Tests for the on-disk transcript cache."""
+
+import pytest
+
+from stt_service.providers.base import TranscriptionResponse, TranscriptionSegment
+from stt_service.services.transcript_cache import TranscriptCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TranscriptCache(tmp_path)
+
+
+@pytest.fixture
+def response():
+    return TranscriptionResponse(
+        text="Hello world",
+        segments=[
+            TranscriptionSegment(text="Hello", start_time=0.0, end_time=1.0, speaker_id="SPEAKER_00"),
+            TranscriptionSegment(text="world", start_time=1.0, end_time=2.0, speaker_id="SPEAKER_01"),
+        ],
+        language_detected="hy",
+        metadata={"model": "gemini-3-flash", "input_tokens": 10},
+    )
+
+
+class TestTranscriptCache:
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get(TranscriptCache.make_key(b"audio", "model")) is None
+
+    def test_roundtrip(self, cache, response):
+        key = TranscriptCache.make_key(b"audio", "model", 1.0, "prompt")
+        cache.put(key, response)
+
+        cached = cache.get(key)
+        assert cached == response
+        assert isinstance(cached.segments[0], TranscriptionSegment)
+
+    def test_key_depends_on_audio(self):
+        assert TranscriptCache.make_key(b"a", "model") != TranscriptCache.make_key(b"b", "model")
+
+    def test_key_depends_on_fingerprint(self):
+        assert TranscriptCache.make_key(b"a", "prompt 1") != TranscriptCache.make_key(b"a", "prompt 2")
+
+    def test_key_is_stable(self):
+        assert TranscriptCache.make_key(b"a", "m", 1.0) == TranscriptCache.make_key(b"a", "m", 1.0)
+
+    def test_corrupt_entry_is_a_miss(self, cache, response):
+        key = TranscriptCache.make_key(b"audio")
+        cache.put(key, response)
+        cache._path(key).write_text("{not json")
+
+        assert cache.get(key) is None
+
+    def test_unserializable_metadata_is_ignored(self, cache, response):
+        response.metadata["bad"] = object()
+        key = TranscriptCache.make_key(b"audio")
+
+        cache.put(key, response)  # must not raise
+
+        assert cache.get(key) is None
+        assert not list(cache.cache_dir.rglob("*.tmp"))
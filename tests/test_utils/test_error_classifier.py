@@ -0,0 +1,43 @@
+"""Tests for provider error classification."""
+
+from stt_service.utils.error_classifier import (
+    ERROR_AUTH,
+    ERROR_INVALID_AUDIO,
+    ERROR_PROVIDER_UNAVAILABLE,
+    ERROR_QUOTA_EXCEEDED,
+    ERROR_RATE_LIMITED,
+    ERROR_TIMEOUT,
+    ERROR_UNKNOWN,
+    classify_error,
+)
+from stt_service.utils.exceptions import ProviderError, RateLimitError
+
+
+class TestClassifyError:
+
+    def test_rate_limit_error(self):
+        code, _ = classify_error(RateLimitError("slow down", provider="gemini"))
+        assert code == ERROR_RATE_LIMITED
+
+    def test_patterns_are_case_insensitive(self):
+        assert classify_error(Exception("Read Timed Out"))[0] == ERROR_TIMEOUT
+        assert classify_error(Exception("RESOURCE EXHAUSTED"))[0] == ERROR_RATE_LIMITED
+        assert classify_error(Exception("Payment Required"))[0] == ERROR_QUOTA_EXCEEDED
+        assert classify_error(Exception("Bad Gateway"))[0] == ERROR_PROVIDER_UNAVAILABLE
+
+    def test_timeout_outranks_auth_regardless_of_position(self):
+        code, _ = classify_error(Exception("HTTP 401 after the request timed out"))
+        assert code == ERROR_TIMEOUT
+
+    def test_non_retryable_provider_error_prefers_auth(self):
+        exc = ProviderError("401 Unauthorized: request timed out", provider="whisper", retryable=False)
+        assert classify_error(exc)[0] == ERROR_AUTH
+
+    def test_non_retryable_provider_error_invalid_audio(self):
+        exc = ProviderError("Bad request: could not decode audio", provider="whisper", retryable=False)
+        assert classify_error(exc)[0] == ERROR_INVALID_AUDIO
+
+    def test_unknown(self):
+        code, message = classify_error(Exception("something odd"))
+        assert code == ERROR_UNKNOWN
+        assert "something odd" in message
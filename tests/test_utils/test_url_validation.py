@@ -1,7 +1,10 @@
 """Tests for SSRF URL validation."""
 
+import socket
+
 import pytest
 
+from stt_service.utils import url_validation
 from stt_service.utils.url_validation import validate_external_url
 
 
@@ -67,3 +70,55 @@ class TestValidateExternalUrl:
     def test_url_with_path_and_query(self):
         url = "https://example.com/api/webhook?token=abc"
         assert validate_external_url(url) == url
+
+
+class TestDnsCache:
+
+    @pytest.fixture
+    def resolver(self, monkeypatch):
+        """Fake getaddrinfo counting lookups, with an empty cache."""
+        calls = []
+
+        def fake_getaddrinfo(host, port, proto=0):
+            calls.append(host)
+            return [(socket.AF_INET, socket.SOCK_STREAM, proto, "", ("93.184.216.34", 0))]
+
+        monkeypatch.setattr(url_validation, "_dns_cache", {})
+        monkeypatch.setattr(url_validation.socket, "getaddrinfo", fake_getaddrinfo)
+        return calls
+
+    def test_repeated_host_resolved_once(self, resolver):
+        validate_external_url("https://example.com/a")
+        validate_external_url("https://example.com/b")
+
+        assert resolver == ["example.com"]
+
+    def test_expired_entry_resolved_again(self, resolver, monkeypatch):
+        monkeypatch.setattr(url_validation, "_DNS_CACHE_TTL", 0.0)
+        validate_external_url("https://example.com/a")
+        validate_external_url("https://example.com/b")
+
+        assert resolver == ["example.com", "example.com"]
+
+    def test_cache_size_bounded(self, resolver, monkeypatch):
+        monkeypatch.setattr(url_validation, "_DNS_CACHE_MAX_SIZE", 2)
+        for host in ("a.example.com", "b.example.com", "c.example.com"):
+            validate_external_url(f"https://{host}/")
+
+        assert list(url_validation._dns_cache) == ["b.example.com", "c.example.com"]
+
+
+class TestIsBlocked:
+
+    @pytest.mark.parametrize("address", [
+        "127.0.0.1", "10.255.255.255", "172.31.0.1", "192.168.0.0",
+        "169.254.169.254", "0.0.0.0", "::1", "fd00::1", "fe80::1%eth0",
+    ])
+    def test_blocked(self, address):
+        assert url_validation._is_blocked(address) is True
+
+    @pytest.mark.parametrize("address", [
+        "93.184.216.34", "172.32.0.1", "11.0.0.1", "2606:2800:220:1::1", "fec0::1",
+    ])
+    def test_allowed(self, address):
+        assert url_validation._is_blocked(address) is False